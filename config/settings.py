@@ -13,12 +13,17 @@ class Config:
     # Analysis settings
     STOCKFISH_PATH = os.getenv("STOCKFISH_PATH", "/usr/local/bin/stockfish")
     ANALYSIS_DEPTH = int(os.getenv("ANALYSIS_DEPTH", "15"))
+    ANALYSIS_NODES = int(os.getenv("ANALYSIS_NODES", "500000"))  # 0 = limit by depth instead
+    ENGINE_HASH_MB = int(os.getenv("ENGINE_HASH_MB", "256"))
+    PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "1"))  # engine processes for batch parsing; 0 = one per CPU
+    PARSE_HASH_BUDGET_MB = int(os.getenv("PARSE_HASH_BUDGET_MB", "1024"))  # total engine hash across parse workers
     
     # Data storage paths
     DATA_DIR = "data"
     RAW_DATA_DIR = os.path.join(DATA_DIR, "raw")
     PROCESSED_DATA_DIR = os.path.join(DATA_DIR, "processed")
     CACHE_DIR = os.path.join(DATA_DIR, "cache")
+    ANALYSIS_CACHE_PATH = os.path.join(CACHE_DIR, "analysis_tt.sqlite3")  # engine results by position
     
     # Analysis parameters
     BLUNDER_THRESHOLD = 200  # centipawns
@@ -32,10 +37,13 @@ class Config:
     REQUEST_TIMEOUT = 30
     MAX_RETRIES = 3
     RETRY_DELAY = 1  # seconds
+    FETCH_WORKERS = 8  # concurrent archive downloads
+    MIN_REQUEST_INTERVAL = 0.1  # seconds between requests, across all workers
     
     # Analysis settings
     OPENING_BOOK_DEPTH = 15  # moves to consider as opening
     TIME_PRESSURE_THRESHOLD = 30  # seconds
     ENDGAME_PIECE_THRESHOLD = 6  # pieces remaining
     TACTICAL_SEARCH_DEPTH = 12  # ply for tactical analysis
-    EVALUATION_MARGIN = 25  # centipawns for "equal" positions
\ No newline at end of file
+    EVALUATION_MARGIN = 25  # centipawns for "equal" positions
+    MIN_ANALYSIS_MOVES = 10  # bullet games lost on time/abandoned before this skip engine analysis
\ No newline at end of file
@@ -8,12 +8,61 @@ and missed opportunities using Stockfish engine evaluation.
 import chess
 import chess.engine
 import chess.pgn
+import chess.polyglot
+import numpy as np
+from collections import Counter, OrderedDict
 from typing import List, Dict, Optional, Tuple
 import logging
 from config.settings import Config
 
 logger = logging.getLogger(__name__)
 
+# Fallback score for engine results without a 'score' entry. Shared so the
+# per-move unpacking doesn't build a fresh PovScore on every analyse() call.
+_ZERO_SCORE = chess.engine.PovScore(chess.engine.Cp(0), chess.WHITE)
+
+# Maximum number of positions kept in the per-analyzer evaluation cache
+_EVAL_CACHE_SIZE = 200_000
+
+# Eval gain (centipawns) at which a move counts as a good move
+_GOOD_MOVE_THRESHOLD = 50
+
+# Move classification codes produced by _classify_and_summarize
+_BLUNDER, _MISTAKE, _INACCURACY, _NEUTRAL, _GOOD_MOVE = range(5)
+_BUCKET_KEYS = (
+    (_BLUNDER, 'blunders'),
+    (_MISTAKE, 'mistakes'),
+    (_INACCURACY, 'inaccuracies'),
+    (_GOOD_MOVE, 'good_moves'),
+)
+
+
+def _classify_and_summarize(
+    eval_changes: np.ndarray,
+    error_thresholds: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Classify moves and reduce them to summary statistics in one numeric pass.
+    
+    Args:
+        eval_changes: Evaluation change per move (centipawns)
+        error_thresholds: Ascending blunder/mistake/inaccuracy bin edges
+        
+    Returns:
+        Tuple of (classification codes, count per code, accuracy percentage)
+    """
+    codes = np.digitize(eval_changes, error_thresholds, right=True)
+    codes[(codes == _NEUTRAL) & (eval_changes >= _GOOD_MOVE_THRESHOLD)] = _GOOD_MOVE
+    counts = np.bincount(codes, minlength=len(_BUCKET_KEYS) + 1)
+    
+    if eval_changes.size == 0:
+        return codes, counts, 0.0
+    
+    # Simple accuracy calculation (can be refined)
+    avg_eval_loss = float(-np.minimum(eval_changes, 0).sum()) / eval_changes.size
+    accuracy = max(0, 100 - (avg_eval_loss / 10))  # Scale to percentage
+    return codes, counts, min(100, accuracy)
+
 
 class TacticalAnalyzer:
     """Analyzes tactical patterns and errors in chess games."""
@@ -28,16 +77,46 @@ class TacticalAnalyzer:
         self.stockfish_path = stockfish_path or Config.STOCKFISH_PATH
         self.engine = None
         
+        # Node limits give a predictable per-call cost and let consecutive
+        # positions reuse the engine's hash table
+        if Config.ANALYSIS_NODES > 0:
+            self._limit = chess.engine.Limit(nodes=Config.ANALYSIS_NODES)
+        else:
+            self._limit = chess.engine.Limit(depth=Config.ANALYSIS_DEPTH)
+        
+        # Engine results keyed by Zobrist hash, shared across games so
+        # common opening positions are only searched once
+        self._eval_cache: OrderedDict = OrderedDict()
+        
+        # Sorted (ascending) eval-loss bin edges for np.digitize
+        self._error_thresholds = np.array([
+            -Config.BLUNDER_THRESHOLD,
+            -Config.MISTAKE_THRESHOLD,
+            -Config.INACCURACY_THRESHOLD,
+        ], dtype=np.float32)
+        
     def _init_engine(self):
         """Initialize Stockfish engine."""
         if self.engine is None:
             try:
                 self.engine = chess.engine.SimpleEngine.popen_uci(self.stockfish_path)
+                self.engine.configure({"Hash": Config.ENGINE_HASH_MB})
                 logger.info("Stockfish engine initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to initialize Stockfish: {e}")
                 raise
     
+    def _analyse(self, board: chess.Board, game: chess.pgn.Game) -> chess.engine.InfoDict:
+        """Analyse a position, reusing cached results for repeated positions."""
+        key = chess.polyglot.zobrist_hash(board)
+        info = self._eval_cache.get(key)
+        if info is None:
+            info = self.engine.analyse(board, self._limit, game=game)
+            if len(self._eval_cache) >= _EVAL_CACHE_SIZE:
+                self._eval_cache.popitem(last=False)
+            self._eval_cache[key] = info
+        return info
+    
     def _close_engine(self):
         """Close Stockfish engine."""
         if self.engine:
@@ -55,6 +134,9 @@ class TacticalAnalyzer:
         Returns:
             Dictionary with tactical analysis results
         """
+        # Keep an engine opened by analyze_tactical_patterns alive across
+        # games so its hash table survives between positions
+        owns_engine = self.engine is None
         try:
             self._init_engine()
             
@@ -65,7 +147,6 @@ class TacticalAnalyzer:
                 return {}
             
             board = game.board()
-            moves = list(game.mainline_moves())
             
             # Determine player color
             white_player = game.headers.get("White", "").lower()
@@ -74,7 +155,7 @@ class TacticalAnalyzer:
             
             tactical_data = {
                 'player_color': player_color,
-                'total_moves': len(moves),
+                'total_moves': 0,
                 'blunders': [],
                 'mistakes': [],
                 'inaccuracies': [],
@@ -83,84 +164,68 @@ class TacticalAnalyzer:
                 'move_evaluations': []
             }
             
-            # Analyze each move
-            for move_num, move in enumerate(moves):
+            # White moves on even plies, black on odd
+            player_parity = 0 if player_color == "white" else 1
+            
+            # Analyze each move, walking the mainline without materializing it
+            move_num = -1
+            for move_num, move in enumerate(game.mainline_moves()):
                 # Only analyze player's moves
-                is_player_move = (move_num % 2 == 0 and player_color == "white") or \
-                               (move_num % 2 == 1 and player_color == "black")
-                
-                if not is_player_move:
+                if move_num % 2 != player_parity:
                     board.push(move)
                     continue
                 
-                # Get position before move
-                position_before = board.copy()
-                
                 # Evaluate position before move
+                ply_before = board.ply()
                 try:
                     if not self.engine:
                         logger.warning("Engine not initialized, skipping move analysis")
                         board.push(move)
                         continue
-                    eval_before = self.engine.analyse(
-                        position_before,
-                        chess.engine.Limit(depth=Config.ANALYSIS_DEPTH)
-                    )
-                    score_before = eval_before.get('score', chess.engine.PovScore(chess.engine.Cp(0), chess.WHITE)).relative.score(mate_score=10000)
+                    eval_before = self._analyse(board, game)
+                    score_before = eval_before.get('score', _ZERO_SCORE).relative.score(mate_score=10000)
+                    
+                    # Find best move (principal variation of the pre-move search)
+                    pv = eval_before.get('pv')
+                    best_move = pv[0] if pv else None
+                    
+                    # SAN needs the pre-move position, so render it before pushing
+                    move_san = board.san(move)
+                    best_move_san = board.san(best_move) if best_move else None
                     
                     # Make the move
                     board.push(move)
                     
                     # Evaluate position after move
-                    eval_after = self.engine.analyse(
-                        board,
-                        chess.engine.Limit(depth=Config.ANALYSIS_DEPTH)
-                    )
-                    score_after = -eval_after.get('score', chess.engine.PovScore(chess.engine.Cp(0), chess.WHITE)).relative.score(mate_score=10000)
+                    eval_after = self._analyse(board, game)
+                    score_after = -eval_after.get('score', _ZERO_SCORE).relative.score(mate_score=10000)
                     
                     # Calculate evaluation change
                     eval_change = score_after - score_before
                     
-                    # Find best move
-                    best_move_info = self.engine.analyse(
-                        position_before,
-                        chess.engine.Limit(depth=Config.ANALYSIS_DEPTH)
-                    )
-                    best_move = best_move_info.get('pv', [None])[0] if best_move_info.get('pv') else None
-                    
                     # Categorize the move
                     move_analysis = {
                         'move_number': move_num // 2 + 1,
                         'move': move.uci(),
-                        'move_san': position_before.san(move),
+                        'move_san': move_san,
                         'eval_before': score_before,
                         'eval_after': score_after,
                         'eval_change': eval_change,
                         'best_move': best_move.uci() if best_move else None,
-                        'best_move_san': position_before.san(best_move) if best_move else None
+                        'best_move_san': best_move_san
                     }
                     
                     tactical_data['move_evaluations'].append(move_analysis)
                     
-                    # Classify move quality
-                    if eval_change <= -Config.BLUNDER_THRESHOLD:
-                        tactical_data['blunders'].append(move_analysis)
-                    elif eval_change <= -Config.MISTAKE_THRESHOLD:
-                        tactical_data['mistakes'].append(move_analysis)
-                    elif eval_change <= -Config.INACCURACY_THRESHOLD:
-                        tactical_data['inaccuracies'].append(move_analysis)
-                    elif eval_change >= 50:  # Good move
-                        tactical_data['good_moves'].append(move_analysis)
-                    
                     # Check for missed tactics (if best move is much better)
                     if best_move and best_move != move:
-                        position_after_best = position_before.copy()
-                        position_after_best.push(best_move)
-                        eval_best = self.engine.analyse(
-                            position_after_best,
-                            chess.engine.Limit(depth=Config.ANALYSIS_DEPTH)
-                        )
-                        score_best = -eval_best.get('score', chess.engine.PovScore(chess.engine.Cp(0), chess.WHITE)).relative.score(mate_score=10000)
+                        # Swap the played move for the best move on the shared board
+                        board.pop()
+                        board.push(best_move)
+                        eval_best = self._analyse(board, game)
+                        board.pop()
+                        board.push(move)
+                        score_best = -eval_best.get('score', _ZERO_SCORE).relative.score(mate_score=10000)
                         
                         if score_best - score_after >= 100:  # Missed significant improvement
                             tactical_data['missed_tactics'].append({
@@ -171,17 +236,31 @@ class TacticalAnalyzer:
                     
                 except Exception as e:
                     logger.warning(f"Error analyzing move {move_num}: {e}")
+                    # Put the shared board back to exactly one ply past the move
+                    while board.ply() > ply_before:
+                        board.pop()
                     board.push(move)
                     continue
             
+            tactical_data['total_moves'] = move_num + 1
+            
+            # Classify and summarize all moves in one columnar pass
+            columns = self._build_move_columns(tactical_data['move_evaluations'])
+            tactical_data['move_columns'] = columns
+            codes, counts, accuracy = _classify_and_summarize(
+                columns['eval_changes'], self._error_thresholds
+            )
+            columns['classifications'] = codes
+            self._bucket_moves(tactical_data, codes)
+            
             # Calculate summary statistics
             tactical_data['summary'] = {
-                'total_blunders': len(tactical_data['blunders']),
-                'total_mistakes': len(tactical_data['mistakes']),
-                'total_inaccuracies': len(tactical_data['inaccuracies']),
-                'total_good_moves': len(tactical_data['good_moves']),
+                'total_blunders': int(counts[_BLUNDER]),
+                'total_mistakes': int(counts[_MISTAKE]),
+                'total_inaccuracies': int(counts[_INACCURACY]),
+                'total_good_moves': int(counts[_GOOD_MOVE]),
                 'total_missed_tactics': len(tactical_data['missed_tactics']),
-                'accuracy': self._calculate_accuracy(tactical_data['move_evaluations'])
+                'accuracy': accuracy
             }
             
             return tactical_data
@@ -190,24 +269,36 @@ class TacticalAnalyzer:
             logger.error(f"Error in tactical analysis: {e}")
             return {}
         finally:
-            self._close_engine()
+            if owns_engine:
+                self._close_engine()
     
-    def _calculate_accuracy(self, move_evaluations: List[Dict]) -> float:
-        """Calculate accuracy percentage based on move evaluations."""
-        if not move_evaluations:
-            return 0.0
-        
-        total_eval_loss = 0
-        for move_eval in move_evaluations:
-            eval_change = move_eval.get('eval_change', 0)
-            # Ensure eval_change is a number, not a list or other type
-            if isinstance(eval_change, (int, float)) and eval_change < 0:
-                total_eval_loss += abs(eval_change)
+    def _build_move_columns(self, move_evaluations: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        Build columnar (struct-of-arrays) views of the per-move evaluations.
         
-        # Simple accuracy calculation (can be refined)
-        avg_eval_loss = total_eval_loss / len(move_evaluations)
-        accuracy = max(0, 100 - (avg_eval_loss / 10))  # Scale to percentage
-        return min(100, accuracy)
+        Args:
+            move_evaluations: List of move analysis dictionaries
+            
+        Returns:
+            Dictionary of NumPy arrays aligned with move_evaluations
+        """
+        count = len(move_evaluations)
+        move_numbers = np.fromiter(
+            (m['move_number'] for m in move_evaluations), dtype=np.int32, count=count
+        )
+        eval_changes = np.fromiter(
+            (m['eval_change'] for m in move_evaluations), dtype=np.float32, count=count
+        )
+        return {
+            'move_numbers': move_numbers,
+            'eval_changes': eval_changes,
+        }
+    
+    def _bucket_moves(self, tactical_data: Dict, codes: np.ndarray) -> None:
+        """Split move evaluations into per-classification lists using their codes."""
+        move_evaluations = tactical_data['move_evaluations']
+        for code, key in _BUCKET_KEYS:
+            tactical_data[key] = [move_evaluations[i] for i in np.flatnonzero(codes == code)]
     
     def analyze_tactical_patterns(self, games_data: List[Dict]) -> Dict:
         """
@@ -236,11 +327,7 @@ class TacticalAnalyzer:
         
         # Analyze each game individually first
         analyzed_games = []
-        total_blunders = 0
-        total_mistakes = 0
-        total_inaccuracies = 0
-        total_moves = 0
-        total_accuracy = 0.0
+        totals = Counter()
         
         for i, game_data in enumerate(games_data):
             try:
@@ -257,11 +344,7 @@ class TacticalAnalyzer:
                     analyzed_games.append(game_tactics)
                     
                     # Accumulate statistics
-                    total_blunders += summary.get('total_blunders', 0)
-                    total_mistakes += summary.get('total_mistakes', 0)
-                    total_inaccuracies += summary.get('total_inaccuracies', 0)
-                    total_moves += summary.get('total_moves', 0)
-                    total_accuracy += summary.get('accuracy', 0)
+                    totals.update(summary)
                     
             except Exception as e:
                 logger.error(f"Error analyzing game {i+1}: {e}")
@@ -270,7 +353,7 @@ class TacticalAnalyzer:
         # Calculate overall statistics
         games_analyzed = len(analyzed_games)
         if games_analyzed > 0:
-            avg_accuracy = total_accuracy / games_analyzed
+            avg_accuracy = totals['accuracy'] / games_analyzed
         else:
             avg_accuracy = 0.0
         
@@ -280,10 +363,10 @@ class TacticalAnalyzer:
         return {
             'total_games': games_analyzed,
             'average_accuracy': avg_accuracy,
-            'total_moves': total_moves,
-            'total_blunders': total_blunders,
-            'total_mistakes': total_mistakes,
-            'total_inaccuracies': total_inaccuracies,
+            'total_moves': totals['total_moves'],
+            'total_blunders': totals['total_blunders'],
+            'total_mistakes': totals['total_mistakes'],
+            'total_inaccuracies': totals['total_inaccuracies'],
             'game_data': analyzed_games
         }
     
@@ -0,0 +1,95 @@
+"""
+Columnar (struct-of-arrays) views over normalized games and profiles.
+
+Analyzers and reports that aggregate numeric fields across many games or
+players can work on these arrays with NumPy instead of reading
+attributes object by object.
+Kept out of the core package exports so importing src.core doesn't
+pull in NumPy.
+"""
+
+from typing import Dict, Sequence
+
+import numpy as np
+
+from .constants import PlayerColor
+from .schemas import NormalizedGame, PlayerProfile
+
+
+def games_to_columns(games: Sequence[NormalizedGame]) -> Dict[str, np.ndarray]:
+    """
+    Convert a batch of games into one array per numeric field.
+
+    All arrays share the same length and order as ``games``. Values are
+    from the analyzed player's perspective.
+
+    Args:
+        games: Normalized games, e.g. one batch from get_games_batched()
+
+    Returns:
+        Dict with 'player_rating' and 'opponent_rating' (NaN where the
+        rating is missing), 'player_is_white', 'score' (1/0.5/0),
+        'total_moves', 'played_at' (POSIX seconds) and 'accuracy' (NaN
+        where the platform reported none)
+    """
+    count = len(games)
+    # float32 holds any rating exactly and leaves room for NaN
+    player_rating = np.empty(count, dtype=np.float32)
+    opponent_rating = np.empty(count, dtype=np.float32)
+    player_is_white = np.empty(count, dtype=np.bool_)
+    score = np.empty(count, dtype=np.float32)
+    total_moves = np.empty(count, dtype=np.int32)
+    played_at = np.empty(count, dtype=np.float64)
+    accuracy = np.empty(count, dtype=np.float32)
+
+    # Single pass over the games, filling every column
+    for i, game in enumerate(games):
+        player, opponent = game.player, game.opponent
+        player_rating[i] = np.nan if player.rating is None else player.rating
+        opponent_rating[i] = np.nan if opponent.rating is None else opponent.rating
+        player_is_white[i] = game.player_color is PlayerColor.WHITE
+        score[i] = game.result.score
+        total_moves[i] = len(game.moves_san)
+        played_at[i] = game.played_at.timestamp()
+        accuracy[i] = np.nan if game.accuracy is None else game.accuracy
+
+    return {
+        "player_rating": player_rating,
+        "opponent_rating": opponent_rating,
+        "player_is_white": player_is_white,
+        "score": score,
+        "total_moves": total_moves,
+        "played_at": played_at,
+        "accuracy": accuracy,
+    }
+
+
+def profile_stats(profiles: Sequence[PlayerProfile]) -> Dict[str, np.ndarray]:
+    """
+    Compute win/draw/loss rates for many profiles at once.
+
+    Matches PlayerProfile.win_rate / draw_rate per element, including 0.0
+    for profiles with no games.
+
+    Args:
+        profiles: Player profiles, e.g. everyone in a scouting report
+
+    Returns:
+        Dict with 'total_games', 'win_rate', 'draw_rate' and 'loss_rate'
+        (percentages), each aligned with ``profiles``
+    """
+    count = len(profiles)
+    totals = np.fromiter((p.total_games for p in profiles), dtype=np.int64, count=count)
+    wins = np.fromiter((p.wins for p in profiles), dtype=np.int64, count=count)
+    draws = np.fromiter((p.draws for p in profiles), dtype=np.int64, count=count)
+    losses = np.fromiter((p.losses for p in profiles), dtype=np.int64, count=count)
+
+    # Divide by 1 where there are no games; the counts are 0 there anyway
+    percent_per_game = 100.0 / np.maximum(totals, 1)
+
+    return {
+        "total_games": totals,
+        "win_rate": wins * percent_per_game,
+        "draw_rate": draws * percent_per_game,
+        "loss_rate": losses * percent_per_game,
+    }
@@ -43,9 +43,9 @@ class GameResult(str, Enum):
     @property
     def score(self) -> float:
         """Return numeric score: 1.0 for win, 0.5 for draw, 0.0 for loss."""
-        if self == GameResult.WIN:
+        if self is GameResult.WIN:
             return 1.0
-        elif self == GameResult.DRAW:
+        elif self is GameResult.DRAW:
             return 0.5
         return 0.0
 
@@ -232,7 +232,7 @@ class PlayerColor(str, Enum):
     @property
     def opponent(self) -> "PlayerColor":
         """Return the opposite color."""
-        return PlayerColor.BLACK if self == PlayerColor.WHITE else PlayerColor.WHITE
+        return PlayerColor.BLACK if self is PlayerColor.WHITE else PlayerColor.WHITE
 
 
 class MoveClassification(str, Enum):
@@ -256,13 +256,16 @@ class MoveClassification(str, Enum):
     @property
     def is_error(self) -> bool:
         """Return True if this is a negative classification."""
-        errors = {
-            MoveClassification.INACCURACY,
-            MoveClassification.MISTAKE,
-            MoveClassification.BLUNDER,
-            MoveClassification.MISSED_WIN,
-        }
-        return self in errors
+        return self in _ERROR_CLASSIFICATIONS
+
+
+# Negative move classifications, built once rather than per is_error call
+_ERROR_CLASSIFICATIONS = frozenset({
+    MoveClassification.INACCURACY,
+    MoveClassification.MISTAKE,
+    MoveClassification.BLUNDER,
+    MoveClassification.MISSED_WIN,
+})
 
 
 # Default thresholds for move classification (in centipawns)
@@ -5,7 +5,76 @@ Provides a hierarchy of exceptions for different error categories,
 enabling precise error handling throughout the application.
 """
 
-from typing import Optional, Any
+import sys
+from functools import lru_cache
+from http import HTTPStatus
+from types import MappingProxyType
+from typing import Optional, Any, Dict, List, Mapping, NoReturn, Tuple
+
+# Shared read-only defaults so exceptions raised without details or
+# supported-value lists don't each allocate an empty container
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_SEQUENCE: tuple = ()
+
+# Stored as a plain int: an HTTPStatus member's repr (and its str() before
+# Python 3.11) renders as 'HTTPStatus.TOO_MANY_REQUESTS' in logs and payloads
+_TOO_MANY_REQUESTS = int(HTTPStatus.TOO_MANY_REQUESTS)
+
+# Longest response body snippet kept on an APIError
+_MAX_RESPONSE_BODY = 512
+
+# Message templates, %-formatted by the constructors below
+_USER_NOT_FOUND_TMPL = "User '%s' not found%s"
+_ON_PLATFORM_TMPL = " on %s"
+_PLATFORM_NOT_SUPPORTED_TMPL = "Platform '%s' is not supported%s"
+_SUPPORTED_TMPL = ". Supported: %s"
+_MISSING_FIELD_TMPL = "Required field '%s' is missing"
+_ENGINE_NOT_FOUND_TMPL = "%s not found at '%s'"
+_LLM_RATE_LIMIT_TMPL = "Rate limit exceeded for %s%s"
+_MODEL_SUFFIX_TMPL = " (%s)"
+_MODEL_NOT_SUPPORTED_TMPL = "Model '%s' is not supported%s%s"
+_BY_PROVIDER_TMPL = " by %s"
+_MISSING_CONFIG_TMPL = "Missing required configuration: %s%s"
+_ENV_VAR_TMPL = " (set %s environment variable)"
+
+# Per-class tuple of every slot name along the MRO, computed once per class
+_SLOT_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """Return all slot names declared by a class and its bases."""
+    names = _SLOT_NAMES.get(cls)
+    if names is None:
+        names = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in klass.__dict__.get("__slots__", ())
+            if name != "_str_cache"
+        )
+        _SLOT_NAMES[cls] = names
+    return names
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern identifier strings that repeat across many exceptions."""
+    return sys.intern(value) if value else value
+
+
+@lru_cache(maxsize=16)
+def _supported_suffix(values: Tuple[str, ...]) -> str:
+    """Format the '. Supported: ...' suffix once per distinct value set."""
+    return _SUPPORTED_TMPL % ", ".join(values)
+
+
+def _restore_error(cls: type, args: tuple, state: Dict[str, Any]) -> "ChessAnalysisError":
+    """Rebuild a pickled exception without re-running its __init__."""
+    error = cls.__new__(cls, *args)
+    error.args = args
+    error.details = _EMPTY_DETAILS
+    error._str_cache = None
+    for name, value in state.items():
+        setattr(error, name, value)
+    return error
 
 
 class ChessAnalysisError(Exception):
@@ -14,18 +83,63 @@ class ChessAnalysisError(Exception):
 
     All custom exceptions inherit from this, making it easy to catch
     any chess analysis related error.
+
+    The string form is built on first use and cached, so instances should
+    be treated as immutable once raised. Subclasses customise the text by
+    overriding _format() rather than __str__.
+
+    Extra context is passed as keyword arguments (``APIError("x", url=u)``)
+    and collected into ``details``.
     """
 
+    __slots__ = ('message', 'details', '_str_cache')
+
     def __init__(
         self,
         message: str,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self.details = details if details else _EMPTY_DETAILS
+        self._str_cache: Optional[str] = None
+
+    def _mutable_details(self) -> dict:
+        """Return a writable details dict, replacing the shared empty default."""
+        if self.details is _EMPTY_DETAILS:
+            self.details = {}
+        return self.details
+
+    @classmethod
+    def raise_expected(cls, *args: Any, **kwargs: Any) -> NoReturn:
+        """
+        Raise an instance as control flow, detached from any exception
+        currently being handled.
+
+        Meant for errors callers routinely catch and act on (RateLimitError,
+        UserNotFoundError). Genuine failures should use a plain raise so
+        the chained context is kept for debugging.
+        """
+        raise cls(*args, **kwargs) from None
+
+    def __reduce__(self):
+        # Subclass __init__ signatures differ from args, so restore slots
+        # directly instead of calling cls(*args)
+        state = {
+            name: getattr(self, name)
+            for name in _slot_names(type(self))
+            if hasattr(self, name)
+        }
+        if state.get("details") is _EMPTY_DETAILS:
+            del state["details"]
+        return _restore_error, (type(self), self.args, state)
 
     def __str__(self) -> str:
+        if self._str_cache is None:
+            self._str_cache = self._format()
+        return self._str_cache
+
+    def _format(self) -> str:
         if self.details:
             return f"{self.message} | Details: {self.details}"
         return self.message
@@ -39,14 +153,16 @@ class ChessAnalysisError(Exception):
 class PlatformError(ChessAnalysisError):
     """Base exception for platform-related errors."""
 
+    __slots__ = ('platform',)
+
     def __init__(
         self,
         message: str,
         platform: Optional[str] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        super().__init__(message, details)
-        self.platform = platform
+        super().__init__(message, **details)
+        self.platform = _intern(platform)
 
 
 class APIError(PlatformError):
@@ -56,6 +172,8 @@ class APIError(PlatformError):
     Includes HTTP status code and response details when available.
     """
 
+    __slots__ = ('status_code', 'response_body', 'url')
+
     def __init__(
         self,
         message: str,
@@ -63,14 +181,15 @@ class APIError(PlatformError):
         status_code: Optional[int] = None,
         response_body: Optional[str] = None,
         url: Optional[str] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        super().__init__(message, platform, details)
+        super().__init__(message, platform, **details)
         self.status_code = status_code
-        self.response_body = response_body
+        # Error pages can be kilobytes of HTML; keep only the head
+        self.response_body = response_body[:_MAX_RESPONSE_BODY] if response_body else None
         self.url = url
 
-    def __str__(self) -> str:
+    def _format(self) -> str:
         parts = [self.message]
         if self.platform:
             parts.append(f"Platform: {self.platform}")
@@ -85,21 +204,24 @@ class RateLimitError(APIError):
     """
     Rate limit exceeded on a platform API.
 
-    Includes retry information when available.
+    Includes retry information when available. Usually control flow
+    for retry loops, so raise it with raise_expected().
     """
 
+    __slots__ = ('retry_after',)
+
     def __init__(
         self,
         message: str = "Rate limit exceeded",
         platform: Optional[str] = None,
         retry_after: Optional[int] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        super().__init__(message, platform, status_code=429, details=details)
+        super().__init__(message, platform, status_code=_TOO_MANY_REQUESTS, **details)
         self.retry_after = retry_after  # Seconds to wait before retry
 
-    def __str__(self) -> str:
-        base = super().__str__()
+    def _format(self) -> str:
+        base = super()._format()
         if self.retry_after:
             return f"{base} | Retry after: {self.retry_after}s"
         return base
@@ -112,32 +234,39 @@ class AuthenticationError(PlatformError):
     Raised when API tokens are invalid, expired, or missing.
     """
 
+    __slots__ = ('requires_token',)
+
     def __init__(
         self,
         message: str = "Authentication failed",
         platform: Optional[str] = None,
         requires_token: bool = True,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        super().__init__(message, platform, details)
+        super().__init__(message, platform, **details)
         self.requires_token = requires_token
 
 
 class UserNotFoundError(PlatformError):
     """
     User/player not found on a platform.
+
+    Usually control flow, so raise it with raise_expected().
     """
 
+    __slots__ = ('username',)
+
     def __init__(
         self,
         username: str,
         platform: Optional[str] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        message = f"User '{username}' not found"
-        if platform:
-            message += f" on {platform}"
-        super().__init__(message, platform, details)
+        message = _USER_NOT_FOUND_TMPL % (
+            username,
+            _ON_PLATFORM_TMPL % platform if platform else "",
+        )
+        super().__init__(message, platform, **details)
         self.username = username
 
 
@@ -146,17 +275,20 @@ class PlatformNotSupportedError(PlatformError):
     Requested platform is not supported.
     """
 
+    __slots__ = ('supported_platforms',)
+
     def __init__(
         self,
         platform: str,
         supported_platforms: Optional[list] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        message = f"Platform '{platform}' is not supported"
-        if supported_platforms:
-            message += f". Supported: {', '.join(supported_platforms)}"
-        super().__init__(message, platform, details)
-        self.supported_platforms = supported_platforms or []
+        message = _PLATFORM_NOT_SUPPORTED_TMPL % (
+            platform,
+            _supported_suffix(tuple(supported_platforms)) if supported_platforms else "",
+        )
+        super().__init__(message, platform, **details)
+        self.supported_platforms = supported_platforms or _EMPTY_SEQUENCE
 
 
 # =============================================================================
@@ -172,20 +304,22 @@ class NormalizationError(ChessAnalysisError):
     the normalized format.
     """
 
+    __slots__ = ('platform', 'field', 'raw_value')
+
     def __init__(
         self,
         message: str,
         platform: Optional[str] = None,
         field: Optional[str] = None,
         raw_value: Any = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        super().__init__(message, details)
-        self.platform = platform
+        super().__init__(message, **details)
+        self.platform = _intern(platform)
         self.field = field
         self.raw_value = raw_value
 
-    def __str__(self) -> str:
+    def _format(self) -> str:
         parts = [self.message]
         if self.platform:
             parts.append(f"Platform: {self.platform}")
@@ -201,13 +335,15 @@ class InvalidPGNError(NormalizationError):
     Invalid or unparseable PGN data.
     """
 
+    __slots__ = ('pgn_snippet',)
+
     def __init__(
         self,
         message: str = "Invalid PGN data",
         pgn_snippet: Optional[str] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        super().__init__(message, field="pgn", details=details)
+        super().__init__(message, field="pgn", **details)
         self.pgn_snippet = pgn_snippet
 
 
@@ -216,14 +352,16 @@ class MissingDataError(NormalizationError):
     Required data is missing from the platform response.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         field: str,
         platform: Optional[str] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        message = f"Required field '{field}' is missing"
-        super().__init__(message, platform=platform, field=field, details=details)
+        message = _MISSING_FIELD_TMPL % field
+        super().__init__(message, platform=platform, field=field, **details)
 
 
 # =============================================================================
@@ -234,14 +372,16 @@ class MissingDataError(NormalizationError):
 class AnalysisError(ChessAnalysisError):
     """Base exception for analysis-related errors."""
 
+    __slots__ = ('analyzer_id',)
+
     def __init__(
         self,
         message: str,
         analyzer_id: Optional[str] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        super().__init__(message, details)
-        self.analyzer_id = analyzer_id
+        super().__init__(message, **details)
+        self.analyzer_id = _intern(analyzer_id)
 
 
 class InsufficientDataError(AnalysisError):
@@ -249,20 +389,22 @@ class InsufficientDataError(AnalysisError):
     Not enough data to perform meaningful analysis.
     """
 
+    __slots__ = ('required_games', 'available_games')
+
     def __init__(
         self,
         message: str = "Insufficient data for analysis",
         required_games: Optional[int] = None,
         available_games: Optional[int] = None,
         analyzer_id: Optional[str] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        super().__init__(message, analyzer_id, details)
+        super().__init__(message, analyzer_id, **details)
         self.required_games = required_games
         self.available_games = available_games
 
-    def __str__(self) -> str:
-        base = super().__str__()
+    def _format(self) -> str:
+        base = super()._format()
         if self.required_games and self.available_games is not None:
             return f"{base} | Required: {self.required_games}, Available: {self.available_games}"
         return base
@@ -273,14 +415,16 @@ class EngineError(AnalysisError):
     Error with chess engine (e.g., Stockfish).
     """
 
+    __slots__ = ('engine_name', 'engine_path')
+
     def __init__(
         self,
         message: str,
         engine_name: Optional[str] = None,
         engine_path: Optional[str] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        super().__init__(message, analyzer_id="engine", details=details)
+        super().__init__(message, analyzer_id="engine", **details)
         self.engine_name = engine_name
         self.engine_path = engine_path
 
@@ -290,14 +434,16 @@ class EngineNotFoundError(EngineError):
     Chess engine executable not found.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         engine_path: str,
         engine_name: str = "Stockfish",
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        message = f"{engine_name} not found at '{engine_path}'"
-        super().__init__(message, engine_name, engine_path, details)
+        message = _ENGINE_NOT_FOUND_TMPL % (engine_name, engine_path)
+        super().__init__(message, engine_name, engine_path, **details)
 
 
 # =============================================================================
@@ -308,16 +454,18 @@ class EngineNotFoundError(EngineError):
 class LLMError(ChessAnalysisError):
     """Base exception for LLM-related errors."""
 
+    __slots__ = ('provider', 'model')
+
     def __init__(
         self,
         message: str,
         provider: Optional[str] = None,
         model: Optional[str] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        super().__init__(message, details)
-        self.provider = provider
-        self.model = model
+        super().__init__(message, **details)
+        self.provider = _intern(provider)
+        self.model = _intern(model)
 
 
 class LLMProviderError(LLMError):
@@ -325,13 +473,15 @@ class LLMProviderError(LLMError):
     Error with LLM provider configuration or availability.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
         provider: str,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        super().__init__(message, provider=provider, details=details)
+        super().__init__(message, provider=provider, **details)
 
 
 class LLMAPIError(LLMError):
@@ -339,15 +489,17 @@ class LLMAPIError(LLMError):
     Error calling LLM API.
     """
 
+    __slots__ = ('status_code',)
+
     def __init__(
         self,
         message: str,
         provider: Optional[str] = None,
         model: Optional[str] = None,
         status_code: Optional[int] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        super().__init__(message, provider, model, details)
+        super().__init__(message, provider, model, **details)
         self.status_code = status_code
 
 
@@ -356,17 +508,20 @@ class LLMRateLimitError(LLMAPIError):
     LLM API rate limit exceeded.
     """
 
+    __slots__ = ('retry_after',)
+
     def __init__(
         self,
         provider: str,
         model: Optional[str] = None,
         retry_after: Optional[int] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        message = f"Rate limit exceeded for {provider}"
-        if model:
-            message += f" ({model})"
-        super().__init__(message, provider, model, status_code=429, details=details)
+        message = _LLM_RATE_LIMIT_TMPL % (
+            provider,
+            _MODEL_SUFFIX_TMPL % model if model else "",
+        )
+        super().__init__(message, provider, model, status_code=_TOO_MANY_REQUESTS, **details)
         self.retry_after = retry_after
 
 
@@ -375,20 +530,22 @@ class ModelNotSupportedError(LLMError):
     Requested LLM model is not supported.
     """
 
+    __slots__ = ('supported_models',)
+
     def __init__(
         self,
         model: str,
         provider: Optional[str] = None,
         supported_models: Optional[list] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        message = f"Model '{model}' is not supported"
-        if provider:
-            message += f" by {provider}"
-        if supported_models:
-            message += f". Supported: {', '.join(supported_models)}"
-        super().__init__(message, provider, model, details)
-        self.supported_models = supported_models or []
+        message = _MODEL_NOT_SUPPORTED_TMPL % (
+            model,
+            _BY_PROVIDER_TMPL % provider if provider else "",
+            _supported_suffix(tuple(supported_models)) if supported_models else "",
+        )
+        super().__init__(message, provider, model, **details)
+        self.supported_models = supported_models or _EMPTY_SEQUENCE
 
 
 # =============================================================================
@@ -399,14 +556,16 @@ class ModelNotSupportedError(LLMError):
 class ReportError(ChessAnalysisError):
     """Base exception for report generation errors."""
 
+    __slots__ = ('report_type',)
+
     def __init__(
         self,
         message: str,
         report_type: Optional[str] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        super().__init__(message, details)
-        self.report_type = report_type
+        super().__init__(message, **details)
+        self.report_type = _intern(report_type)
 
 
 class ReportGenerationError(ReportError):
@@ -414,7 +573,7 @@ class ReportGenerationError(ReportError):
     Error generating a report.
     """
 
-    pass
+    __slots__ = ()
 
 
 class InvalidReportConfigError(ReportError):
@@ -422,14 +581,16 @@ class InvalidReportConfigError(ReportError):
     Invalid report configuration.
     """
 
+    __slots__ = ('invalid_fields',)
+
     def __init__(
         self,
         message: str,
         invalid_fields: Optional[list] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        super().__init__(message, details=details)
-        self.invalid_fields = invalid_fields or []
+        super().__init__(message, **details)
+        self.invalid_fields = invalid_fields or _EMPTY_SEQUENCE
 
 
 # =============================================================================
@@ -442,14 +603,16 @@ class ConfigurationError(ChessAnalysisError):
     Error in application configuration.
     """
 
+    __slots__ = ('config_key',)
+
     def __init__(
         self,
         message: str,
         config_key: Optional[str] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        super().__init__(message, details)
-        self.config_key = config_key
+        super().__init__(message, **details)
+        self.config_key = _intern(config_key)
 
 
 class MissingConfigError(ConfigurationError):
@@ -457,14 +620,64 @@ class MissingConfigError(ConfigurationError):
     Required configuration is missing.
     """
 
+    __slots__ = ('env_var',)
+
     def __init__(
         self,
         config_key: str,
         env_var: Optional[str] = None,
-        details: Optional[dict] = None,
+        **details: Any,
     ):
-        message = f"Missing required configuration: {config_key}"
-        if env_var:
-            message += f" (set {env_var} environment variable)"
-        super().__init__(message, config_key, details)
+        message = _MISSING_CONFIG_TMPL % (
+            config_key,
+            _ENV_VAR_TMPL % env_var if env_var else "",
+        )
+        super().__init__(message, config_key, **details)
         self.env_var = env_var
+
+
+# =============================================================================
+# Error Collection
+# =============================================================================
+
+
+class ErrorCollector:
+    """
+    Records errors from bulk paths instead of raising one per item.
+
+    Raising and catching an exception for every bad row is expensive when
+    failures are common (e.g. normalizing thousands of games). Callers
+    record the exception class and arguments here; instances are only
+    built if someone asks for them.
+    """
+
+    __slots__ = ('_records',)
+
+    def __init__(self):
+        self._records: List[Tuple[type, tuple, Dict[str, Any]]] = []
+
+    def record(self, exc_cls: type, *args: Any, **kwargs: Any) -> None:
+        """Record an error that would have been raised as exc_cls(*args, **kwargs)."""
+        self._records.append((exc_cls, args, kwargs))
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def errors(self) -> List[ChessAnalysisError]:
+        """Build the recorded exceptions."""
+        return [exc_cls(*args, **kwargs) for exc_cls, args, kwargs in self._records]
+
+    @property
+    def first(self) -> Optional[ChessAnalysisError]:
+        """Build only the first recorded exception, or None if there is none."""
+        if not self._records:
+            return None
+        exc_cls, args, kwargs = self._records[0]
+        return exc_cls(*args, **kwargs)
+
+    def raise_if_any(self) -> None:
+        """Raise the first recorded error, if there is one."""
+        error = self.first
+        if error is not None:
+            raise error
@@ -4,6 +4,9 @@ Protocol definitions for multi-platform chess analysis.
 Protocols define the interfaces that all implementations must follow.
 Using Protocol (PEP 544) enables structural subtyping - classes don't
 need to explicitly inherit, they just need to implement the methods.
+Conformance is checked statically; the protocols are deliberately not
+runtime_checkable, since isinstance() against a Protocol probes every
+member on each call.
 
 This module defines protocols for:
 - Platform connectors (Chess.com, Lichess, etc.)
@@ -14,29 +17,36 @@ This module defines protocols for:
 - Image generators
 """
 
-from abc import abstractmethod
+from __future__ import annotations
+
+from itertools import islice
 from typing import (
+    TYPE_CHECKING,
     Protocol,
     List,
     Dict,
     Optional,
     Iterator,
     Any,
-    runtime_checkable,
-)
-from datetime import datetime
-
-from .schemas import (
-    NormalizedGame,
-    PlayerProfile,
-    GameFilter,
-    AnalysisResult,
-    ReportConfig,
 )
-from .constants import Platform
+
+# Only referenced in annotations, which stay unevaluated strings
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    import numpy as np
+
+    from .schemas import (
+        NormalizedGame,
+        PlayerProfile,
+        GameFilter,
+        AnalysisResult,
+        ReportConfig,
+    )
+    from .constants import Platform
+    from .exceptions import ErrorCollector
 
 
-@runtime_checkable
 class PlatformConnector(Protocol):
     """
     Protocol for platform API connectors.
@@ -129,6 +139,38 @@ class PlatformConnector(Protocol):
         """
         ...
 
+    def get_games_batched(
+        self,
+        username: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        game_filter: Optional[GameFilter] = None,
+        batch_size: int = 128,
+    ) -> Iterator[List[NormalizedGame]]:
+        """
+        Fetch games in lists of up to batch_size.
+
+        Lets consumers that work column-wise process a batch at once
+        instead of resuming the generator for every game.
+        """
+        ...
+
+    def get_games_columns(
+        self,
+        username: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        game_filter: Optional[GameFilter] = None,
+        batch_size: int = 1024,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Fetch games straight into columnar arrays.
+
+        See src.core.columns.games_to_columns() for the columns. Only one
+        batch of NormalizedGame objects is alive at a time.
+        """
+        ...
+
     def get_current_games(self, username: str) -> List[Dict[str, Any]]:
         """
         Get currently active games (for anti-scouting features).
@@ -159,7 +201,83 @@ class PlatformConnector(Protocol):
         ...
 
 
-@runtime_checkable
+class ConnectorMixin:
+    """
+    Shared concrete behaviour for PlatformConnector implementations.
+
+    Connectors inherit this to get get_games_list(), get_games_batched()
+    and get_games_columns() for free on top of their own get_games()
+    generator.
+    """
+
+    def get_games_list(
+        self,
+        username: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        game_filter: Optional[GameFilter] = None,
+    ) -> List[NormalizedGame]:
+        """
+        Fetch games as a list (convenience method).
+
+        Same as get_games() but returns a list instead of iterator.
+        Use get_games() for large datasets to avoid memory issues.
+        """
+        return list(self.get_games(username, start_date, end_date, game_filter))
+
+    def get_games_batched(
+        self,
+        username: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        game_filter: Optional[GameFilter] = None,
+        batch_size: int = 128,
+    ) -> Iterator[List[NormalizedGame]]:
+        """
+        Fetch games in lists of up to batch_size.
+
+        Lets consumers that work column-wise process a batch at once
+        instead of resuming the generator for every game.
+        """
+        games = self.get_games(username, start_date, end_date, game_filter)
+        while True:
+            batch = list(islice(games, batch_size))
+            if not batch:
+                break
+            yield batch
+
+    def get_games_columns(
+        self,
+        username: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        game_filter: Optional[GameFilter] = None,
+        batch_size: int = 1024,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Fetch games straight into columnar arrays.
+
+        Each batch is converted with games_to_columns() and then dropped,
+        so only one batch of NormalizedGame objects is alive at a time.
+        """
+        # Imported here so the core package doesn't require NumPy
+        import numpy as np
+
+        from .columns import games_to_columns
+
+        chunks = [
+            games_to_columns(batch)
+            for batch in self.get_games_batched(
+                username, start_date, end_date, game_filter, batch_size
+            )
+        ]
+        if len(chunks) == 1:
+            return chunks[0]
+        if not chunks:
+            return games_to_columns([])
+        return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+
+
 class GameNormalizer(Protocol):
     """
     Protocol for converting platform-specific data to normalized format.
@@ -177,16 +295,19 @@ class GameNormalizer(Protocol):
         self,
         raw_game: Dict[str, Any],
         player_username: str,
-    ) -> NormalizedGame:
+        collector: Optional[ErrorCollector] = None,
+    ) -> Optional[NormalizedGame]:
         """
         Convert platform-specific game data to normalized format.
 
         Args:
             raw_game: Raw game data from the platform API
             player_username: The username of the player we're analyzing
+            collector: Optional collector for bulk runs; expected data
+                problems are recorded there instead of raised
 
         Returns:
-            NormalizedGame instance
+            NormalizedGame instance, or None if an error was recorded
 
         Raises:
             NormalizationError: If game data cannot be normalized
@@ -211,13 +332,16 @@ class GameNormalizer(Protocol):
         ...
 
 
-@runtime_checkable
 class Analyzer(Protocol):
     """
     Protocol for game analyzers.
 
     Analyzers take normalized game data and produce analysis results.
     They are platform-agnostic and work with NormalizedGame objects.
+    Analyzers whose work is mostly numeric aggregation may also offer
+    analyze_columns(columns, **kwargs), taking the arrays built by
+    src.core.columns.games_to_columns(); it is optional and not part of
+    this protocol.
     """
 
     @property
@@ -263,7 +387,6 @@ class Analyzer(Protocol):
         ...
 
 
-@runtime_checkable
 class ReportGenerator(Protocol):
     """
     Protocol for report generators.
@@ -307,7 +430,6 @@ class ReportGenerator(Protocol):
         ...
 
 
-@runtime_checkable
 class LLMProvider(Protocol):
     """
     Protocol for LLM (Large Language Model) providers.
@@ -386,7 +508,6 @@ class LLMProvider(Protocol):
         ...
 
 
-@runtime_checkable
 class ImageGenerator(Protocol):
     """
     Protocol for image generation providers.
@@ -12,9 +12,12 @@ Design principles:
 - JSON serializable for caching and API responses
 """
 
+import io
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import TYPE_CHECKING, Callable, List, Dict, Optional, Any, Tuple
 
 from .constants import (
     Platform,
@@ -26,6 +29,52 @@ from .constants import (
     MoveClassification,
 )
 
+if TYPE_CHECKING:
+    import chess.pgn
+
+
+@lru_cache(maxsize=256)
+def _format_time_control(initial_seconds: int, increment_seconds: int, time_class: TimeClass) -> str:
+    """Format a time control for display; only a few distinct ones occur in practice."""
+    minutes = initial_seconds // 60
+    seconds = initial_seconds % 60
+
+    if time_class is TimeClass.CORRESPONDENCE:
+        days = initial_seconds // 86400
+        return f"{days} day{'s' if days != 1 else ''}/move"
+
+    if seconds > 0:
+        time_str = f"{minutes}:{seconds:02d}"
+    else:
+        time_str = str(minutes)
+
+    if increment_seconds > 0:
+        return f"{time_str}+{increment_seconds}"
+    return f"{time_str} min"
+
+
+def _parse_pgn(pgn: str) -> Optional["chess.pgn.Game"]:
+    """Parse a PGN with python-chess."""
+    # Imported here so the schemas don't require python-chess
+    import chess.pgn
+
+    return chess.pgn.read_game(io.StringIO(pgn))
+
+
+@lru_cache(maxsize=64)
+def _mainline_uci(pgn: str) -> Tuple[str, ...]:
+    """
+    Mainline moves of a PGN in UCI notation.
+
+    Bounded LRU keyed on the PGN text, holding only an immutable tuple, so
+    repeat calls for the same game skip the parse without sharing a
+    mutable chess.pgn.Game between callers.
+    """
+    game = _parse_pgn(pgn)
+    if game is None:
+        return ()
+    return tuple(move.uci() for move in game.mainline_moves())
+
 
 @dataclass
 class TimeControl:
@@ -42,21 +91,8 @@ class TimeControl:
     @property
     def display_name(self) -> str:
         """Human-readable time control string."""
-        minutes = self.initial_seconds // 60
-        seconds = self.initial_seconds % 60
-
-        if self.time_class == TimeClass.CORRESPONDENCE:
-            days = self.initial_seconds // 86400
-            return f"{days} day{'s' if days != 1 else ''}/move"
-
-        if seconds > 0:
-            time_str = f"{minutes}:{seconds:02d}"
-        else:
-            time_str = str(minutes)
-
-        if self.increment_seconds > 0:
-            return f"{time_str}+{self.increment_seconds}"
-        return f"{time_str} min"
+        # Memoized per distinct (initial, increment, class) by _format_time_control
+        return _format_time_control(self.initial_seconds, self.increment_seconds, self.time_class)
 
     @property
     def estimated_game_duration(self) -> int:
@@ -88,6 +124,12 @@ class Opening:
     moves_in_theory: int = 0  # Number of moves following known theory
     ply_count: int = 0  # Total opening ply count
 
+    def __post_init__(self):
+        # A game history repeats a few hundred openings at most
+        self.name = sys.intern(self.name)
+        if self.eco_code:
+            self.eco_code = sys.intern(self.eco_code)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -160,6 +202,12 @@ class PlayerInfo:
     title: Optional[str] = None  # GM, IM, FM, NM, CM, WGM, etc.
     provisional: bool = False  # Whether rating is provisional
 
+    def __post_init__(self):
+        # The same players and titles recur across a game history
+        self.username = sys.intern(self.username)
+        if self.title:
+            self.title = sys.intern(self.title)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -214,26 +262,46 @@ class NormalizedGame:
     # Platform-specific metadata (for features unique to a platform)
     platform_metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        self.player_username = sys.intern(self.player_username)
+
+    def _side(self) -> tuple:
+        """
+        Resolve (player_color, player, opponent) and memoize it.
+
+        Filters and analyzers read the side many times per game. The memo is
+        a plain attribute rather than a field, so it stays out of asdict(),
+        and it is recomputed whenever white, black, white's username or
+        player_username has been replaced since it was built.
+        """
+        white, black, username = self.white, self.black, self.player_username
+        white_name = white.username
+        memo = self.__dict__.get("_side_memo")
+        if (memo is None or memo[0] is not white or memo[1] is not black
+                or memo[2] is not white_name or memo[3] is not username):
+            # Exact match is the common case and needs no lowercased copies
+            if white_name == username or white_name.lower() == username.lower():
+                side = (PlayerColor.WHITE, white, black)
+            else:
+                side = (PlayerColor.BLACK, black, white)
+            memo = (white, black, white_name, username, side)
+            self._side_memo = memo
+        return memo[4]
+
     @property
     def player_color(self) -> PlayerColor:
         """Determine which color the analyzed player played."""
-        if self.white.username.lower() == self.player_username.lower():
-            return PlayerColor.WHITE
-        return PlayerColor.BLACK
+        return self._side()[0]
 
     @property
     def opponent(self) -> PlayerInfo:
         """Get the opponent's player info."""
-        if self.player_color == PlayerColor.WHITE:
-            return self.black
-        return self.white
+        return self._side()[2]
 
     @property
     def player(self) -> PlayerInfo:
         """Get the analyzed player's info."""
-        if self.player_color == PlayerColor.WHITE:
-            return self.white
-        return self.black
+        return self._side()[1]
 
     @property
     def opponent_rating(self) -> int:
@@ -255,6 +323,40 @@ class NormalizedGame:
         """Number of full moves (White + Black = 1 full move)."""
         return (self.total_moves + 1) // 2
 
+    def parsed_game(self) -> Optional["chess.pgn.Game"]:
+        """
+        Parse the PGN with python-chess.
+
+        pgn stays the source of truth. Each call returns a new game, so
+        callers are free to modify it.
+
+        Returns:
+            The parsed game, or None if there is no PGN
+        """
+        if not self.pgn:
+            return None
+        return _parse_pgn(self.pgn)
+
+    @property
+    def moves_uci(self) -> List[str]:
+        """Mainline moves in UCI notation, derived from the PGN."""
+        if not self.pgn:
+            return []
+        return list(_mainline_uci(self.pgn))
+
+    def classify_player_moves(self) -> Dict[MoveClassification, List[MoveAnalysis]]:
+        """
+        Group the player's analyzed moves by classification.
+
+        Built in a single pass over move_analysis, so callers that need
+        several classifications can fetch them all at once.
+        """
+        buckets: Dict[MoveClassification, List[MoveAnalysis]] = {}
+        for move in self.move_analysis:
+            if move.is_player_move:
+                buckets.setdefault(move.classification, []).append(move)
+        return buckets
+
     @property
     def player_moves(self) -> List[MoveAnalysis]:
         """Get only the player's moves from move analysis."""
@@ -264,24 +366,24 @@ class NormalizedGame:
     def blunders(self) -> List[MoveAnalysis]:
         """Get all blunders by the player."""
         return [
-            m for m in self.player_moves
-            if m.classification == MoveClassification.BLUNDER
+            m for m in self.move_analysis
+            if m.is_player_move and m.classification == MoveClassification.BLUNDER
         ]
 
     @property
     def mistakes(self) -> List[MoveAnalysis]:
         """Get all mistakes by the player."""
         return [
-            m for m in self.player_moves
-            if m.classification == MoveClassification.MISTAKE
+            m for m in self.move_analysis
+            if m.is_player_move and m.classification == MoveClassification.MISTAKE
         ]
 
     @property
     def inaccuracies(self) -> List[MoveAnalysis]:
         """Get all inaccuracies by the player."""
         return [
-            m for m in self.player_moves
-            if m.classification == MoveClassification.INACCURACY
+            m for m in self.move_analysis
+            if m.is_player_move and m.classification == MoveClassification.INACCURACY
         ]
 
     def to_dict(self) -> Dict[str, Any]:
@@ -430,11 +532,59 @@ class GameFilter:
             return False
 
         # Color
-        if self.color_filter and game.player_color != self.color_filter:
+        if self.color_filter and game.player_color is not self.color_filter:
             return False
 
         return True
 
+    def compile_predicate(self) -> Callable[[NormalizedGame], bool]:
+        """
+        Build a predicate equivalent to matches() for filtering many games.
+
+        Only the criteria that are set become checks, with their values
+        bound up front, so unset criteria cost nothing per game.
+        """
+        checks: List[Callable[[NormalizedGame], bool]] = []
+
+        if self.start_date:
+            checks.append(lambda game, start=self.start_date: game.played_at >= start)
+        if self.end_date:
+            checks.append(lambda game, end=self.end_date: game.played_at <= end)
+        if self.time_classes:
+            checks.append(
+                lambda game, allowed=frozenset(self.time_classes):
+                    game.time_control.time_class in allowed
+            )
+        if self.variants:
+            checks.append(lambda game, allowed=frozenset(self.variants): game.variant in allowed)
+        if self.rated_only:
+            checks.append(lambda game: game.is_rated)
+        if self.min_opponent_rating:
+            checks.append(
+                lambda game, low=self.min_opponent_rating: game.opponent_rating >= low
+            )
+        if self.max_opponent_rating:
+            checks.append(
+                lambda game, high=self.max_opponent_rating: game.opponent_rating <= high
+            )
+        if self.result_filter:
+            checks.append(lambda game, allowed=frozenset(self.result_filter): game.result in allowed)
+        if self.color_filter:
+            checks.append(lambda game, color=self.color_filter: game.player_color is color)
+
+        if not checks:
+            return lambda game: True
+        if len(checks) == 1:
+            return checks[0]
+
+        def predicate(game: NormalizedGame, checks=tuple(checks)) -> bool:
+            for check in checks:
+                if not check(game):
+                    return False
+            return True
+
+        return predicate
+
 
 @dataclass
 class AnalysisResult:
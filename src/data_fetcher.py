@@ -6,11 +6,18 @@ rate limiting, caching, and error handling.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import gzip
 import json
 import os
+import re
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Tuple
 from tqdm import tqdm
 import logging
 
@@ -20,6 +27,21 @@ from config.settings import Config
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Year and month at the end of an archive URL: .../games/2023/01
+_ARCHIVE_RE = re.compile(r'/(\d{4})/(\d{2})/?$')
+
+# Compact, non-indented output keeps json on its C encoder for cache and
+# raw game files, which are only read back by code
+_CACHE_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+# Cache files are gzipped: PGN-heavy archives shrink several-fold, and a low
+# level keeps compression cheap next to the network fetch it replaces
+_CACHE_COMPRESS_LEVEL = 3
+
+# How long after a UTC month ends before its archive is treated as final;
+# games still finishing at the boundary can land in it for a while
+_ARCHIVE_SETTLE_TIME = timedelta(days=1)
+
 
 class ChessComDataFetcher:
     """Fetches chess game data from Chess.com API."""
@@ -41,83 +63,155 @@ class ChessComDataFetcher:
             'User-Agent': 'ChessAnalysisApp/1.0 (Contact: your-email@example.com)'
         })
         
+        # Retry transient failures with exponential backoff, honouring the
+        # server's Retry-After on 429s; the pool covers every fetch worker
+        retry = Retry(
+            total=Config.MAX_RETRIES,
+            backoff_factor=Config.RETRY_DELAY,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_maxsize=Config.FETCH_WORKERS)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Requests are spaced out across worker threads, not per thread
+        self._rate_lock = threading.Lock()
+        self._last_request_time = 0.0
+        
+        # Parsed cache entries by key, tagged with the file's mtime so a file
+        # rewritten elsewhere is re-read. Entries are shared; treat as read-only.
+        self._memory_cache: Dict[str, Tuple[int, Dict]] = {}
+        
         # Ensure cache directory exists
         os.makedirs(Config.CACHE_DIR, exist_ok=True)
     
-    def _make_request(self, url: str, max_retries: Optional[int] = None) -> Optional[Dict]:
+    def _rate_limit(self) -> None:
+        """Wait until at least MIN_REQUEST_INTERVAL has passed since the last request."""
+        with self._rate_lock:
+            wait_time = Config.MIN_REQUEST_INTERVAL - (time.monotonic() - self._last_request_time)
+            if wait_time > 0:
+                time.sleep(wait_time)
+            self._last_request_time = time.monotonic()
+    
+    def _make_request(self, url: str) -> Optional[Dict]:
         """
         Make a request with retry logic and rate limiting.
         
         Args:
             url: URL to request
-            max_retries: Maximum number of retries
             
         Returns:
             JSON response data or None if failed
         """
-        max_retries = max_retries or Config.MAX_RETRIES
-        
-        for attempt in range(max_retries + 1):
-            try:
-                response = self.session.get(url, timeout=Config.REQUEST_TIMEOUT)
-                
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 429:  # Rate limited
-                    wait_time = Config.RETRY_DELAY * (2 ** attempt)
-                    logger.warning(f"Rate limited. Waiting {wait_time} seconds...")
-                    time.sleep(wait_time)
-                    continue
-                elif response.status_code == 404:
-                    logger.error(f"Resource not found: {url}")
-                    return None
-                else:
-                    logger.warning(f"HTTP {response.status_code} for {url}")
-                    
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
-                
-            if attempt < max_retries:
-                time.sleep(Config.RETRY_DELAY * (attempt + 1))
-        
-        logger.error(f"Failed to fetch {url} after {max_retries + 1} attempts")
+        response = self._send_request(url)
+        return response.json() if response is not None else None
+    
+    def _send_request(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[requests.Response]:
+        """
+        Send a rate-limited GET request; retries happen in the session adapter.
+        
+        Args:
+            url: URL to request
+            headers: Extra request headers (e.g. conditional-request validators)
+            
+        Returns:
+            The response for 200 or 304 Not Modified, None if failed
+        """
+        self._rate_limit()
+        try:
+            response = self.session.get(url, timeout=Config.REQUEST_TIMEOUT, headers=headers)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            return None
+        
+        if response.status_code in (200, 304):
+            return response
+        if response.status_code == 404:
+            logger.error(f"Resource not found: {url}")
+        else:
+            logger.error(f"HTTP {response.status_code} for {url} after retries")
         return None
     
     def _get_cache_path(self, cache_key: str) -> str:
         """Get cache file path for a given key."""
-        return os.path.join(Config.CACHE_DIR, f"{cache_key}.json")
+        return os.path.join(Config.CACHE_DIR, f"{cache_key}.json.gz")
+    
+    def _read_cache_entry(self, cache_key: str) -> Optional[Dict]:
+        """
+        Read a cache envelope regardless of age.
+        
+        Returns:
+            Dict with 'data', 'cached_at' (as datetime) and any stored
+            'etag' / 'last_modified' validators, or None if missing/invalid
+        """
+        cache_path = self._get_cache_path(cache_key)
+        
+        try:
+            mtime = os.stat(cache_path).st_mtime_ns
+        except OSError:
+            return None
+        
+        # Repeat hits skip the read and JSON parse entirely
+        memo = self._memory_cache.get(cache_key)
+        if memo and memo[0] == mtime:
+            return memo[1]
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_data = json.loads(gzip.decompress(f.read()))
+            
+            cached_at = datetime.fromisoformat(cached_data.get('cached_at', ''))
+            # Older cache files stored naive local time
+            if cached_at.tzinfo is None:
+                cached_at = cached_at.astimezone(timezone.utc)
+            entry = {
+                **cached_data,
+                'cached_at': cached_at,
+                'data': cached_data['data'],
+            }
+        except (OSError, EOFError, zlib.error, json.JSONDecodeError, KeyError, ValueError) as e:
+            logger.warning(f"Invalid cache file {cache_path}: {e}")
+            return None
+        
+        self._memory_cache[cache_key] = (mtime, entry)
+        return entry
     
     def _load_from_cache(self, cache_key: str) -> Optional[Dict]:
         """Load data from cache if it exists and is recent."""
-        cache_path = self._get_cache_path(cache_key)
+        entry = self._read_cache_entry(cache_key)
         
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, 'r') as f:
-                    cached_data = json.load(f)
-                
-                # Check if cache is less than 1 hour old
-                cache_time = datetime.fromisoformat(cached_data.get('cached_at', ''))
-                if datetime.now() - cache_time < timedelta(hours=1):
-                    logger.info(f"Using cached data for {cache_key}")
-                    return cached_data['data']
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                logger.warning(f"Invalid cache file {cache_path}: {e}")
+        # Check if cache is less than 1 hour old
+        if entry and datetime.now(timezone.utc) - entry['cached_at'] < timedelta(hours=1):
+            logger.info(f"Using cached data for {cache_key}")
+            return entry['data']
         
         return None
     
-    def _save_to_cache(self, cache_key: str, data: Dict) -> None:
-        """Save data to cache with timestamp."""
+    def _save_to_cache(self, cache_key: str, data: Dict, etag: Optional[str] = None,
+                       last_modified: Optional[str] = None) -> None:
+        """Save data to cache with timestamp and optional HTTP validators."""
         cache_path = self._get_cache_path(cache_key)
         
+        cached_at = datetime.now(timezone.utc)
         cached_data = {
-            'cached_at': datetime.now().isoformat(),
+            'cached_at': cached_at.isoformat(),
             'data': data
         }
+        if etag:
+            cached_data['etag'] = etag
+        if last_modified:
+            cached_data['last_modified'] = last_modified
         
         try:
-            with open(cache_path, 'w') as f:
-                json.dump(cached_data, f, indent=2)
+            payload = _CACHE_ENCODER.encode(cached_data).encode('utf-8')
+            with open(cache_path, 'wb') as f:
+                f.write(gzip.compress(payload, compresslevel=_CACHE_COMPRESS_LEVEL))
+            self._memory_cache[cache_key] = (
+                os.stat(cache_path).st_mtime_ns,
+                {**cached_data, 'cached_at': cached_at},
+            )
         except Exception as e:
             logger.warning(f"Failed to save cache {cache_path}: {e}")
     
@@ -177,18 +271,66 @@ class ChessComDataFetcher:
         Returns:
             List of game dictionaries
         """
-        cache_key = f"games_{self.username}_{year}_{month:02d}"
+        cached_games = self._load_month_from_cache(year, month)
+        if cached_games is not None:
+            return cached_games
         
-        # Try cache first
-        cached_data = self._load_from_cache(cache_key)
-        if cached_data:
-            return cached_data.get('games', [])
+        return self._fetch_games_for_month(year, month)
+    
+    def _month_cache_key(self, year: int, month: int) -> str:
+        """Cache key for a monthly games archive."""
+        return f"games_{self.username}_{year}_{month:02d}"
+    
+    def _load_month_from_cache(self, year: int, month: int) -> Optional[List[Dict]]:
+        """Return a month's games from cache if still valid, or None."""
+        cache_key = self._month_cache_key(year, month)
+        entry = self._read_cache_entry(cache_key)
+        if not entry or not entry['data']:
+            return None
+        
+        # A finished month's archive never changes, so a copy cached once the
+        # (UTC) month has ended and settled is good forever; otherwise fall
+        # back to the TTL
+        next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        month_end = datetime(*next_month, 1, tzinfo=timezone.utc)
+        cached_at = entry['cached_at']
+        if (cached_at >= month_end + _ARCHIVE_SETTLE_TIME
+                or datetime.now(timezone.utc) - cached_at < timedelta(hours=1)):
+            logger.info(f"Using cached data for {cache_key}")
+            return entry['data'].get('games', [])
         
+        return None
+    
+    def _fetch_games_for_month(self, year: int, month: int) -> List[Dict]:
+        """Download a month's games, revalidating any stale cached copy."""
+        cache_key = self._month_cache_key(year, month)
         url = f"{self.base_url}/player/{self.username}/games/{year}/{month:02d}"
-        data = self._make_request(url)
+        
+        # Conditional request: the server answers 304 if our copy is current
+        entry = self._read_cache_entry(cache_key)
+        headers = {}
+        if entry and entry['data']:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        
+        response = self._send_request(url, headers=headers)
+        if response is None:
+            return []
+        
+        if response.status_code == 304:
+            logger.info(f"Archive unchanged for {cache_key}")
+            data = entry['data']
+            etag = response.headers.get('ETag', entry.get('etag'))
+            last_modified = response.headers.get('Last-Modified', entry.get('last_modified'))
+        else:
+            data = response.json()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
         
         if data:
-            self._save_to_cache(cache_key, data)
+            self._save_to_cache(cache_key, data, etag=etag, last_modified=last_modified)
             return data.get('games', [])
         
         return []
@@ -214,60 +356,71 @@ class ChessComDataFetcher:
         
         # Filter archives by date range if specified
         filtered_archives = []
+        start_month = (start_date.year, start_date.month) if start_date else None
+        end_month = (end_date.year, end_date.month) if end_date else None
         for archive_url in archives:
             # Extract year/month from URL: .../games/2023/01
-            parts = archive_url.split('/')
-            if len(parts) >= 2:
-                try:
-                    year = int(parts[-2])
-                    month = int(parts[-1])
-                    archive_date = datetime(year, month, 1)
-                    
-                    # Check if archive is within date range
-                    if start_date and archive_date < start_date.replace(day=1):
-                        continue
-                    if end_date and archive_date > end_date.replace(day=1):
-                        continue
-                    
-                    filtered_archives.append((year, month))
-                except (ValueError, IndexError):
-                    continue
-        
-        # Fetch games from filtered archives
+            match = _ARCHIVE_RE.search(archive_url)
+            if not match:
+                continue
+            year_month = (int(match.group(1)), int(match.group(2)))
+            
+            # Check if archive is within date range
+            if start_month and year_month < start_month:
+                continue
+            if end_month and year_month > end_month:
+                continue
+            
+            filtered_archives.append(year_month)
+        
+        # Serve cached months directly; only download the rest
+        games_by_month = {}
+        to_fetch = []
+        for year, month in filtered_archives:
+            cached_games = self._load_month_from_cache(year, month)
+            if cached_games is not None:
+                games_by_month[(year, month)] = cached_games
+            else:
+                to_fetch.append((year, month))
+        
+        # Downloads overlap; _rate_limit() keeps the overall request rate polite
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=Config.FETCH_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._fetch_games_for_month, year, month): (year, month)
+                    for year, month in to_fetch
+                }
+                for future in tqdm(as_completed(futures), total=len(futures), desc="Fetching game archives"):
+                    games_by_month[futures[future]] = future.result()
+        
+        # Assemble in archive order, filtering by exact date range if specified.
+        # Bounds become epoch seconds once so each game is a plain int compare.
+        start_ts = start_date.timestamp() if start_date else float('-inf')
+        end_ts = end_date.timestamp() if end_date else float('inf')
         all_games = []
-        for year, month in tqdm(filtered_archives, desc="Fetching game archives"):
-            games = self.get_games_for_month(year, month)
+        for year_month in filtered_archives:
+            games = games_by_month[year_month]
             
-            # Filter games by exact date range if specified
             if start_date or end_date:
-                filtered_games = []
-                for game in games:
-                    game_date = datetime.fromtimestamp(game.get('end_time', 0))
-                    
-                    if start_date and game_date < start_date:
-                        continue
-                    if end_date and game_date > end_date:
-                        continue
-                    
-                    filtered_games.append(game)
-                
-                games = filtered_games
+                games = [
+                    game for game in games
+                    if start_ts <= game.get('end_time', 0) <= end_ts
+                ]
             
             all_games.extend(games)
-            
-            # Be respectful to the API
-            time.sleep(0.1)
         
         logger.info(f"Fetched {len(all_games)} games")
         return all_games
     
-    def save_games_to_file(self, games: List[Dict], filename: Optional[str] = None) -> str:
+    def save_games_to_file(self, games: List[Dict], filename: Optional[str] = None,
+                           pretty: bool = False) -> str:
         """
         Save games to a JSON file.
         
         Args:
             games: List of game dictionaries
             filename: Output filename. If None, generates based on username and date.
+            pretty: Indent the JSON for reading by hand (slower, larger file)
             
         Returns:
             Path to saved file
@@ -280,7 +433,10 @@ class ChessComDataFetcher:
         os.makedirs(Config.RAW_DATA_DIR, exist_ok=True)
         
         with open(filepath, 'w') as f:
-            json.dump(games, f, indent=2)
+            if pretty:
+                json.dump(games, f, indent=2)
+            else:
+                f.write(_CACHE_ENCODER.encode(games))
         
         logger.info(f"Saved {len(games)} games to {filepath}")
         return filepath
@@ -8,8 +8,16 @@ information including move analysis, time usage, and game phases.
 import chess
 import chess.pgn
 import chess.engine
+import chess.polyglot
+import itertools
+import numpy as np
 import re
 import json
+import os
+import sqlite3
+import multiprocessing.util
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from io import StringIO
@@ -19,37 +27,209 @@ from config.settings import Config
 
 logger = logging.getLogger(__name__)
 
+# Fallback when the engine returns no score
+_ZERO_SCORE = chess.engine.PovScore(chess.engine.Cp(0), chess.WHITE)
+
+
+# Clock annotation in move comments (format: [%clk 0:05:23])
+_CLK_RE = re.compile(r'\[%clk (\d+):(\d+):(\d+)\]')
+
+
+def _clock_times(pgn_string: str) -> List[int]:
+    """Remaining clock time in seconds for every annotated move, in PGN order."""
+    return [
+        int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+        for hours, minutes, seconds in _CLK_RE.findall(pgn_string)
+    ]
+
+
+# Compact encoder for parsed-game output; datetimes are written via str()
+_OUTPUT_ENCODER = json.JSONEncoder(separators=(',', ':'), default=str)
+
+# Chess.com result codes mapped to the player's score; anything else is a draw
+_RESULT_MAP = {
+    'win': '1',
+    'checkmated': '0',
+    'agreed': '1/2',
+    'resigned': '0',
+    'timeout': '0',
+    'repetition': '1/2',
+    'stalemate': '1/2',
+    'insufficient': '1/2'
+}
+
+# Classifications that end the opening's "in theory" stretch
+_OPENING_ERRORS = frozenset(('inaccuracy', 'mistake', 'blunder'))
+
+# Recently analysed positions kept in memory, keyed by transposition key
+_POSITION_CACHE_SIZE = 200_000
+
+# Evaluations are clamped to this many centipawns so they fit in int16.
+# Mate in n scores ±(_EVAL_LIMIT - n); centipawn scores are clamped below
+# _MATE_THRESHOLD, so anything beyond it is a mate score.
+_EVAL_LIMIT = 32000
+_MATE_THRESHOLD = _EVAL_LIMIT - 1000
+
+# Results that end a game without it being played out
+_UNPLAYED_RESULTS = frozenset(('timeout', 'abandoned'))
+
+# Seconds a write to the shared analysis cache waits for another process's lock
+_TT_BUSY_TIMEOUT = 30.0
+
+# Integer codes for move classifications, used to count them with bincount
+_CLASSIFICATION_CODES = {'blunder': 0, 'mistake': 1, 'inaccuracy': 2, 'good': 3, 'unknown': 4}
+
+
+def _move_columns(move_analysis: List[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Columnar view of per-move data, built in a single pass.
+    
+    Args:
+        move_analysis: Move dictionaries from _analyze_moves
+        
+    Returns:
+        Dict of equal-length arrays: 'move_number', 'is_player_move',
+        'time_remaining', 'evaluation' (int16 centipawns, 0 where not
+        evaluated), 'evaluated' and 'classification' (codes from
+        _CLASSIFICATION_CODES)
+    """
+    count = len(move_analysis)
+    move_number = np.empty(count, dtype=np.int16)
+    is_player_move = np.empty(count, dtype=np.bool_)
+    time_remaining = np.empty(count, dtype=np.int32)
+    evaluation = np.zeros(count, dtype=np.int16)
+    evaluated = np.zeros(count, dtype=np.bool_)
+    classification = np.empty(count, dtype=np.int8)
+    
+    for i, move in enumerate(move_analysis):
+        move_number[i] = move['move_number']
+        is_player_move[i] = move['is_player_move']
+        time_remaining[i] = move['time_remaining']
+        if move['evaluation'] is not None:
+            evaluation[i] = move['evaluation']
+            evaluated[i] = True
+        classification[i] = _CLASSIFICATION_CODES.get(move['classification'], 4)
+    
+    return {
+        'move_number': move_number,
+        'is_player_move': is_player_move,
+        'time_remaining': time_remaining,
+        'evaluation': evaluation,
+        'evaluated': evaluated,
+        'classification': classification,
+    }
+
+
+def _tt_key(board: chess.Board) -> int:
+    """Zobrist hash of a position, folded into SQLite's signed 64-bit range."""
+    key = chess.polyglot.zobrist_hash(board)
+    return key - (1 << 64) if key >= (1 << 63) else key
+
 
 class GameParser:
     """Parses and analyzes chess games from PGN data."""
     
-    def __init__(self, stockfish_path: Optional[str] = None):
+    def __init__(self, stockfish_path: Optional[str] = None, store_fen: bool = False):
         """
         Initialize the game parser.
         
         Args:
             stockfish_path: Path to Stockfish engine executable
+            store_fen: Keep the FEN of each player move in the move data.
+                Off by default since the stored PGN already determines
+                every position; see fen_at().
         """
         self.stockfish_path = stockfish_path or Config.STOCKFISH_PATH
-        self.engine = None
-        self._init_engine()
+        self.store_fen = store_fen
+        
+        # Stockfish is started on first use, so parsers that never analyse
+        # a move (e.g. the coordinator of a worker pool) don't spawn one
+        self._engine: Optional[chess.engine.SimpleEngine] = None
+        self._engine_started = False
+        
+        # Lowercased once; compared against both players of every game
+        self._username_lc = Config.CHESS_COM_USERNAME.lower()
+        
+        # Transposition table of engine results, persisted across runs.
+        # New entries are buffered and written once per game.
+        self._tt: Optional[sqlite3.Connection] = None
+        self._tt_pending: Dict[int, Tuple[int, int, Optional[str]]] = {}
+        self._init_tt()
+        
+        # In-memory LRU in front of it, so opening positions shared by many
+        # games in a batch skip both the Zobrist hash and the SQLite lookup
+        self._pos_cache: OrderedDict = OrderedDict()
+    
+    @property
+    def engine(self) -> Optional[chess.engine.SimpleEngine]:
+        """Stockfish engine, started on first access (None if it failed to start)."""
+        if not self._engine_started:
+            self._engine_started = True
+            self._init_engine()
+        return self._engine
     
     def _init_engine(self):
         """Initialize the Stockfish engine."""
         try:
-            self.engine = chess.engine.SimpleEngine.popen_uci(self.stockfish_path)
+            self._engine = chess.engine.SimpleEngine.popen_uci(self.stockfish_path)
+            self._engine.configure({"Hash": Config.ENGINE_HASH_MB})
             logger.info("Stockfish engine initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Stockfish engine: {e}")
             logger.error("Analysis features requiring engine evaluation will be disabled")
     
-    def __del__(self):
-        """Clean up the engine when parser is destroyed."""
-        if self.engine:
+    def _init_tt(self):
+        """Open (or create) the on-disk analysis cache."""
+        try:
+            os.makedirs(os.path.dirname(Config.ANALYSIS_CACHE_PATH), exist_ok=True)
+            # Parallel parse_games_batch workers share this file: wait for
+            # each other's writes instead of failing with "database is locked"
+            self._tt = sqlite3.connect(Config.ANALYSIS_CACHE_PATH, timeout=_TT_BUSY_TIMEOUT)
+            self._tt.execute("PRAGMA journal_mode=WAL")
+            # tt_v2: mate scores are ±(_EVAL_LIMIT - n); the old tt table
+            # stored them as ±(10000 - n), indistinguishable from centipawns
+            self._tt.execute(
+                "CREATE TABLE IF NOT EXISTS tt_v2 ("
+                "key INTEGER PRIMARY KEY, depth INTEGER, score INTEGER, pv TEXT)"
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Analysis cache unavailable, positions will not be reused: {e}")
+            self._tt = None
+    
+    def _flush_tt(self):
+        """Write buffered engine results to the on-disk cache."""
+        if not self._tt_pending:
+            return
+        if self._tt is not None:
             try:
-                self.engine.quit()
+                with self._tt:
+                    self._tt.executemany(
+                        "INSERT OR REPLACE INTO tt_v2 (key, depth, score, pv) VALUES (?, ?, ?, ?)",
+                        [(key, *entry) for key, entry in self._tt_pending.items()],
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to update analysis cache: {e}")
+        self._tt_pending.clear()
+    
+    def close(self):
+        """Quit the engine and flush and close the analysis cache."""
+        if getattr(self, '_engine', None) is not None:
+            try:
+                self._engine.quit()
+            except:
+                pass
+            self._engine = None
+        if getattr(self, '_tt', None) is not None:
+            try:
+                self._flush_tt()
+                self._tt.close()
             except:
                 pass
+            self._tt = None
+    
+    def __del__(self):
+        """Clean up the engine when parser is destroyed."""
+        self.close()
     
     def parse_chess_com_game(self, game_data: Dict) -> Optional[Dict]:
         """
@@ -78,8 +258,14 @@ class GameParser:
                 logger.warning("Failed to parse PGN")
                 return None
             
-            # Extract move analysis
-            move_analysis = self._analyze_moves(game, metadata['player_color'])
+            # Extract move analysis, skipping the engine for short bullet
+            # games that were lost on time or abandoned
+            if self._is_unplayed_game(game_data, game):
+                move_analysis = []
+            else:
+                move_analysis = self._analyze_moves(
+                    game, metadata['player_color'], _clock_times(pgn_string)
+                )
             
             # Determine game phases
             game_phases = self._determine_game_phases(move_analysis)
@@ -88,7 +274,7 @@ class GameParser:
             opening_analysis = self._analyze_opening(game, move_analysis)
             
             # Calculate game statistics
-            statistics = self._calculate_statistics(move_analysis, metadata['player_color'])
+            statistics = self._calculate_statistics(_move_columns(move_analysis), metadata['player_color'])
             
             return {
                 'game_metadata': metadata,
@@ -103,6 +289,21 @@ class GameParser:
             logger.error(f"Error parsing game: {e}")
             return None
     
+    def _is_unplayed_game(self, game_data: Dict, game: chess.pgn.Game) -> bool:
+        """Whether a game is a short bullet game decided by timeout or abandonment."""
+        if game_data.get('time_class') != 'bullet':
+            return False
+        
+        results = {
+            game_data.get('white', {}).get('result'),
+            game_data.get('black', {}).get('result'),
+        }
+        if results.isdisjoint(_UNPLAYED_RESULTS):
+            return False
+        
+        # Full moves played, rounded up
+        return (game.end().ply() + 1) // 2 < Config.MIN_ANALYSIS_MOVES
+    
     def _extract_metadata(self, game_data: Dict) -> Optional[Dict]:
         """Extract game metadata from Chess.com game data."""
         try:
@@ -110,7 +311,7 @@ class GameParser:
             white_player = game_data.get('white', {})
             black_player = game_data.get('black', {})
             
-            username = Config.CHESS_COM_USERNAME.lower()
+            username = self._username_lc
             
             if white_player.get('username', '').lower() == username:
                 player_color = 'white'
@@ -125,18 +326,7 @@ class GameParser:
                 return None
             
             # Convert result to standard format
-            result_map = {
-                'win': '1',
-                'checkmated': '0',
-                'agreed': '1/2',
-                'resigned': '0',
-                'timeout': '0',
-                'repetition': '1/2',
-                'stalemate': '1/2',
-                'insufficient': '1/2'
-            }
-            
-            result = result_map.get(player_result, '1/2')
+            result = _RESULT_MAP.get(player_result, '1/2')
             
             return {
                 'game_id': game_data.get('uuid', ''),
@@ -155,61 +345,81 @@ class GameParser:
             logger.error(f"Error extracting metadata: {e}")
             return None
     
-    def _analyze_moves(self, game: chess.pgn.Game, player_color: str) -> List[Dict]:
+    def _analyze_moves(self, game: chess.pgn.Game, player_color: str,
+                       clock_times: Optional[List[int]] = None) -> List[Dict]:
         """
         Analyze each move in the game.
         
         Args:
             game: Parsed PGN game
             player_color: Color the player was playing ('white' or 'black')
+            clock_times: Remaining clock per ply, scanned from the PGN in one
+                pass. Ignored unless every mainline move has one.
             
         Returns:
             List of move analysis dictionaries
         """
+        if clock_times is not None and len(clock_times) != game.end().ply():
+            clock_times = None
+        
         move_analysis = []
+        append = move_analysis.append
         board = game.board()
         node = game
         move_number = 1
+        player_turn = chess.WHITE if player_color == 'white' else chess.BLACK
+        analyse_player_moves = self.engine is not None
+        store_fen = self.store_fen
         
         while node.variations:
             node = node.variation(0)
             move = node.move
             
             # Determine if this is the player's move
-            is_player_move = (board.turn == chess.WHITE and player_color == 'white') or \
-                           (board.turn == chess.BLACK and player_color == 'black')
+            is_player_move = board.turn == player_turn
             
             # Extract time information
-            time_info = self._extract_time_info(node)
+            if clock_times is not None:
+                time_remaining = clock_times[len(move_analysis)]
+            else:
+                time_remaining = self._extract_time_info(node).get('time_remaining', 0)
             
-            # Get position evaluation if engine is available
+            # Evaluate the positions before and after the move, each once,
+            # both from the mover's point of view
             evaluation = None
+            evaluation_after = None
             best_move = None
-            if self.engine and is_player_move:
+            if analyse_player_moves and is_player_move:
                 try:
-                    info = self.engine.analyse(board, chess.engine.Limit(depth=Config.ANALYSIS_DEPTH))
-                    evaluation = info.get('score', chess.engine.PovScore(chess.engine.Cp(0), chess.WHITE)).relative.score()
-                    best_move = str(info.get('pv', [None])[0]) if info.get('pv') else None
-                except:
+                    evaluation, best_move = self._analyse(board, game)
+                    
+                    board.push(move)
+                    try:
+                        score_after, _ = self._analyse(board, game)
+                    finally:
+                        board.pop()
+                    # Negate: after the push the score is from the opponent's side
+                    evaluation_after = -score_after
+                except Exception:
                     pass
             
-            # Classify move quality
-            classification = self._classify_move(board, move, evaluation, best_move)
+            # Classify move quality (opponent moves are never evaluated)
+            classification = self._classify_move(evaluation, evaluation_after) if is_player_move else 'unknown'
             
-            move_data = {
+            # SAN and FEN are only kept for the player's own moves
+            append({
                 'move_number': move_number,
-                'move': str(move),
-                'san': board.san(move),
+                'move': move.uci(),
+                'san': board.san(move) if is_player_move else None,
                 'is_player_move': is_player_move,
-                'time_spent': time_info.get('time_spent', 0),
-                'time_remaining': time_info.get('time_remaining', 0),
+                'time_spent': 0,  # a single clock reading can't give time spent
+                'time_remaining': time_remaining,
                 'evaluation': evaluation,
+                'evaluation_after': evaluation_after,
                 'best_move': best_move,
                 'classification': classification,
-                'fen': board.fen()
-            }
-            
-            move_analysis.append(move_data)
+                'fen': board.fen() if store_fen and is_player_move else None
+            })
             
             # Make the move
             board.push(move)
@@ -217,15 +427,39 @@ class GameParser:
             if board.turn == chess.WHITE:
                 move_number += 1
         
+        self._flush_tt()
         return move_analysis
     
+    @staticmethod
+    def fen_at(pgn_string: str, ply: int) -> Optional[str]:
+        """
+        Rebuild the position after a given number of half-moves.
+        
+        Args:
+            pgn_string: PGN as stored with a parsed game
+            ply: Half-moves played from the start position (0 = initial)
+            
+        Returns:
+            FEN string, or None if the PGN can't be read or is shorter than ply
+        """
+        game = chess.pgn.read_game(StringIO(pgn_string))
+        if game is None:
+            return None
+        
+        board = game.board()
+        played = 0
+        for move in itertools.islice(game.mainline_moves(), ply):
+            board.push(move)
+            played += 1
+        
+        return board.fen() if played == ply else None
+    
     def _extract_time_info(self, node: chess.pgn.GameNode) -> Dict:
         """Extract time information from a move node."""
         comment = node.comment or ''
         
         # Parse time from comment (format: [%clk 0:05:23])
-        time_pattern = r'\[%clk (\d+):(\d+):(\d+)\]'
-        match = re.search(time_pattern, comment)
+        match = _CLK_RE.search(comment)
         
         if match:
             hours, minutes, seconds = map(int, match.groups())
@@ -242,49 +476,80 @@ class GameParser:
             'time_remaining': time_remaining
         }
     
-    def _classify_move(self, board: chess.Board, move: chess.Move, 
-                      evaluation: Optional[int], best_move: Optional[str]) -> str:
+    def _analyse(self, board: chess.Board, game: Optional[chess.pgn.Game] = None) -> Tuple[int, Optional[str]]:
+        """
+        Evaluate a position, consulting the transposition table first.
+        
+        Args:
+            board: Position to evaluate
+            game: Game the position belongs to. The engine is only sent
+                ucinewgame when this changes, so its hash table carries
+                over between plies of the same game.
+            
+        Returns:
+            Tuple of (score in centipawns for the side to move, with mate in
+            n as ±(_EVAL_LIMIT - n), best move in UCI)
+        """
+        depth = Config.ANALYSIS_DEPTH
+        
+        # Both caches hold (depth, score, best move); results searched at
+        # least as deep as requested are reused as-is
+        pos_key = board._transposition_key()
+        entry = self._pos_cache.get(pos_key)
+        if entry is not None and entry[0] >= depth:
+            self._pos_cache.move_to_end(pos_key)
+            return entry[1], entry[2]
+        
+        key = _tt_key(board)
+        entry = self._tt_pending.get(key)
+        if entry is None and self._tt is not None:
+            entry = self._tt.execute(
+                "SELECT depth, score, pv FROM tt_v2 WHERE key = ?", (key,)
+            ).fetchone()
+        if entry is None or entry[0] < depth:
+            info = self.engine.analyse(board, chess.engine.Limit(depth=depth), game=game)
+            pov_score = info.get('score', _ZERO_SCORE).relative
+            if pov_score.is_mate():
+                score = max(-_EVAL_LIMIT, min(_EVAL_LIMIT, pov_score.score(mate_score=_EVAL_LIMIT)))
+            else:
+                score = max(-_MATE_THRESHOLD, min(_MATE_THRESHOLD, pov_score.score()))
+            best_move = info['pv'][0].uci() if info.get('pv') else None
+            entry = (depth, score, best_move)
+            self._tt_pending[key] = entry
+        
+        if pos_key in self._pos_cache:
+            self._pos_cache.move_to_end(pos_key)
+        elif len(self._pos_cache) >= _POSITION_CACHE_SIZE:
+            self._pos_cache.popitem(last=False)
+        self._pos_cache[pos_key] = entry
+        return entry[1], entry[2]
+    
+    def _classify_move(self, prev_eval: Optional[int], post_eval: Optional[int]) -> str:
         """
         Classify move quality based on evaluation.
         
         Args:
-            board: Current board position
-            move: Move played
-            evaluation: Position evaluation after move
-            best_move: Best move according to engine
+            prev_eval: Evaluation before the move, from the mover's side
+            post_eval: Evaluation after the move, from the mover's side
             
         Returns:
             Move classification string
         """
-        if not self.engine or evaluation is None:
+        if prev_eval is None or post_eval is None:
             return 'unknown'
         
-        try:
-            # Get evaluation before the move
-            board_copy = board.copy()
-            board_copy.pop()  # Undo the move
-            
-            info = self.engine.analyse(board_copy, chess.engine.Limit(depth=Config.ANALYSIS_DEPTH))
-            prev_eval = info.get('score', chess.engine.PovScore(chess.engine.Cp(0), chess.WHITE)).relative.score()
-            
-            if prev_eval is None:
-                return 'unknown'
-            
-            # Calculate centipawn loss
-            eval_diff = abs(evaluation - prev_eval) if evaluation and prev_eval else 0
-            
-            # Classify based on centipawn loss
-            if eval_diff >= Config.BLUNDER_THRESHOLD:
-                return 'blunder'
-            elif eval_diff >= Config.MISTAKE_THRESHOLD:
-                return 'mistake'
-            elif eval_diff >= Config.INACCURACY_THRESHOLD:
-                return 'inaccuracy'
-            else:
-                return 'good'
-                
-        except:
-            return 'unknown'
+        # Calculate centipawn loss
+        eval_diff = prev_eval - post_eval
+        
+        # Classify based on centipawn loss
+        if eval_diff >= Config.BLUNDER_THRESHOLD:
+            return 'blunder'
+        elif eval_diff >= Config.MISTAKE_THRESHOLD:
+            return 'mistake'
+        elif eval_diff >= Config.INACCURACY_THRESHOLD:
+            return 'inaccuracy'
+        else:
+            return 'good'
     
     def _determine_game_phases(self, move_analysis: List[Dict]) -> Dict:
         """
@@ -329,10 +594,9 @@ class GameParser:
         moves_in_theory = 0
         first_inaccuracy_move = None
         
-        for i, move_data in enumerate(move_analysis[:Config.OPENING_BOOK_DEPTH]):
-            if move_data['classification'] in ['inaccuracy', 'mistake', 'blunder']:
-                if first_inaccuracy_move is None:
-                    first_inaccuracy_move = i + 1
+        for move_data in itertools.islice(move_analysis, Config.OPENING_BOOK_DEPTH):
+            if move_data['classification'] in _OPENING_ERRORS:
+                first_inaccuracy_move = moves_in_theory + 1
                 break
             moves_in_theory += 1
         
@@ -344,34 +608,35 @@ class GameParser:
             'opening_advantage': 0  # Would need engine evaluation
         }
     
-    def _calculate_statistics(self, move_analysis: List[Dict], player_color: str) -> Dict:
+    def _calculate_statistics(self, columns: Dict[str, np.ndarray], player_color: str) -> Dict:
         """
         Calculate game statistics.
         
         Args:
-            move_analysis: List of move analysis data
+            columns: Columnar move data from _move_columns()
             player_color: Player's color
             
         Returns:
             Game statistics
         """
-        player_moves = [move for move in move_analysis if move['is_player_move']]
+        player_mask = columns['is_player_move']
+        total_moves = int(np.count_nonzero(player_mask))
         
-        if not player_moves:
+        if not total_moves:
             return {}
         
-        # Count move classifications
-        blunders = sum(1 for move in player_moves if move['classification'] == 'blunder')
-        mistakes = sum(1 for move in player_moves if move['classification'] == 'mistake')
-        inaccuracies = sum(1 for move in player_moves if move['classification'] == 'inaccuracy')
-        good_moves = sum(1 for move in player_moves if move['classification'] == 'good')
+        # Count move classifications in one pass
+        blunders, mistakes, inaccuracies, good_moves = (
+            int(count) for count in np.bincount(columns['classification'][player_mask], minlength=5)[:4]
+        )
         
-        total_moves = len(player_moves)
         accuracy = (good_moves / total_moves * 100) if total_moves > 0 else 0
         
-        # Calculate average centipawn loss (simplified)
-        evaluations = [move['evaluation'] for move in player_moves if move['evaluation'] is not None]
-        avg_centipawn_loss = sum(abs(e) for e in evaluations) / len(evaluations) if evaluations else 0
+        # Calculate average centipawn loss (simplified); mate scores aren't
+        # centipawns and are left out, as before they were scored at all
+        evaluations = np.abs(columns['evaluation'].astype(np.int32))
+        evaluations = evaluations[player_mask & columns['evaluated'] & (evaluations <= _MATE_THRESHOLD)]
+        avg_centipawn_loss = float(evaluations.mean()) if evaluations.size else 0
         
         return {
             'total_moves': total_moves,
@@ -383,22 +648,50 @@ class GameParser:
             'average_centipawn_loss': avg_centipawn_loss
         }
     
-    def parse_games_batch(self, games_data: List[Dict]) -> List[Dict]:
+    def parse_games_batch(self, games_data: List[Dict], workers: Optional[int] = None) -> List[Dict]:
         """
         Parse multiple games in batch.
         
+        Games are independent, so with more than one worker they are spread
+        over a process pool where each process runs its own single-threaded
+        Stockfish; that scales better than one multi-threaded engine.
+        
         Args:
             games_data: List of raw game data from Chess.com
+            workers: Number of worker processes. Defaults to
+                Config.PARSE_WORKERS (1, i.e. serial), or one per CPU if
+                that is 0. Capped so the workers' engine hash tables
+                together stay within Config.PARSE_HASH_BUDGET_MB.
             
         Returns:
             List of parsed game analyses
         """
-        parsed_games = []
+        if workers is None:
+            workers = Config.PARSE_WORKERS
+        workers = workers or os.cpu_count() or 1
+        workers = min(
+            workers,
+            max(1, Config.PARSE_HASH_BUDGET_MB // max(1, Config.ENGINE_HASH_MB)),
+            len(games_data),
+        )
         
-        for i, game_data in enumerate(games_data):
-            logger.info(f"Parsing game {i + 1}/{len(games_data)}")
-            
-            parsed_game = self.parse_chess_com_game(game_data)
+        if workers > 1:
+            logger.info(f"Parsing {len(games_data)} games with {workers} engine processes")
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker_parser,
+                initargs=(self.stockfish_path, self.store_fen, _config_snapshot()),
+            ) as executor:
+                results = executor.map(_parse_in_worker, games_data, chunksize=4)
+                parsed_results = list(results)
+        else:
+            parsed_results = []
+            for i, game_data in enumerate(games_data):
+                logger.info(f"Parsing game {i + 1}/{len(games_data)}")
+                parsed_results.append(self.parse_chess_com_game(game_data))
+        
+        parsed_games = []
+        for i, parsed_game in enumerate(parsed_results):
             if parsed_game:
                 parsed_games.append(parsed_game)
             else:
@@ -408,6 +701,47 @@ class GameParser:
         return parsed_games
 
 
+# Per-process parser used by parse_games_batch workers
+_worker_parser: Optional[GameParser] = None
+
+
+def _config_snapshot() -> Dict:
+    """
+    Current Config settings, including values changed at runtime.
+    
+    Spawned workers re-import Config from the environment, so e.g. a
+    username set in a notebook would otherwise never reach them.
+    """
+    return {name: value for name, value in vars(Config).items() if name.isupper()}
+
+
+def _init_worker_parser(stockfish_path: str, store_fen: bool = False,
+                        settings: Optional[Dict] = None):
+    """Apply the parent's settings and start this worker's own single-threaded engine."""
+    global _worker_parser
+    for name, value in (settings or {}).items():
+        setattr(Config, name, value)
+    _worker_parser = GameParser(stockfish_path, store_fen=store_fen)
+    if _worker_parser.engine:
+        _worker_parser.engine.configure({"Threads": 1})
+    # Pool workers leave through os._exit, which skips atexit handlers;
+    # multiprocessing still runs its own finalizers on the way out
+    multiprocessing.util.Finalize(None, _close_worker_parser, exitpriority=10)
+
+
+def _close_worker_parser():
+    """Quit the worker's engine and flush its analysis cache."""
+    global _worker_parser
+    if _worker_parser is not None:
+        _worker_parser.close()
+        _worker_parser = None
+
+
+def _parse_in_worker(game_data: Dict) -> Optional[Dict]:
+    """Parse one game in a worker process."""
+    return _worker_parser.parse_chess_com_game(game_data)
+
+
 def main():
     """Example usage of the game parser."""
     import os
@@ -427,7 +761,7 @@ def main():
         os.makedirs(Config.PROCESSED_DATA_DIR, exist_ok=True)
         
         with open(output_path, 'w') as f:
-            json.dump(parsed_games, f, indent=2, default=str)
+            f.write(_OUTPUT_ENCODER.encode(parsed_games))
         
         print(f"Parsed {len(parsed_games)} games and saved to {output_path}")
     else:
@@ -26,7 +26,9 @@ class ChessComConfig:
     timeout: int = 30  # seconds
     max_retries: int = 3
     retry_delay: float = 1.0  # seconds (base delay, exponential backoff applied)
-    min_request_interval: float = 0.1  # seconds between requests
+    min_request_interval: float = 0.1  # seconds between requests, sustained
+    burst_capacity: int = 5  # requests allowed back-to-back before throttling
+    fetch_concurrency: int = 4  # monthly archives fetched in parallel
 
     # Cache Settings
     cache_enabled: bool = True
@@ -8,14 +8,25 @@ Handles rate limiting, caching, and data normalization.
 import json
 import logging
 import os
+import tempfile
+import threading
 import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import methodcaller
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Iterator
+from typing import Dict, Any, Optional, List, Iterator, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.core.constants import Platform, TimeClass
+from src.core.protocols import ConnectorMixin
 from src.core.schemas import (
     NormalizedGame,
     PlayerProfile,
@@ -26,6 +37,7 @@ from src.core.exceptions import (
     RateLimitError,
     UserNotFoundError,
     NormalizationError,
+    ErrorCollector,
 )
 
 from .config import ChessComConfig, DEFAULT_CONFIG
@@ -33,8 +45,62 @@ from .normalizer import ChessComNormalizer
 
 logger = logging.getLogger(__name__)
 
+# Compact encoder for cache files; archives are large and never read by hand
+_CACHE_ENCODER = json.JSONEncoder(separators=(",", ":"))
 
-class ChessComConnector:
+# Cache files hold the bare response body; their mtime is the cache time.
+# (Files named "<key>.json" used a {"cached_at", "data"} wrapper.)
+_CACHE_SUFFIX = ".body.json"
+
+# Sort key for raw games; C-level, and tolerates a missing end_time
+_END_TIME_KEY = methodcaller("get", "end_time", 0)
+
+# Seconds between writes of pending cache entries to disk
+_CACHE_FLUSH_INTERVAL = 5.0
+
+# Characters in an endpoint that can't appear in a cache filename
+_ENDPOINT_TRANSLATE = str.maketrans({"/": "_", "?": "_", "&": "_"})
+
+
+def _write_cache_entries(
+    cache_dir: Path,
+    lock: threading.Lock,
+    dirty: Dict[str, Tuple[float, Any, bytes]],
+) -> None:
+    """
+    Write and clear a connector's pending cache entries.
+
+    Takes only the cache state, not the connector, so the exit-time flush
+    registered with weakref.finalize doesn't keep the connector alive.
+    """
+    with lock:
+        pending = dict(dirty)
+        dirty.clear()
+
+    for cache_key, (_, _, payload) in pending.items():
+        try:
+            # Write to a temporary file and rename it into place, so
+            # readers (including other processes) never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, cache_dir / f"{cache_key}{_CACHE_SUFFIX}")
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            logger.debug(f"Cached {cache_key}")
+        except Exception as e:
+            logger.warning(f"Error saving to cache: {e}")
+
+
+@lru_cache(maxsize=1024)
+def _endpoint_cache_key(endpoint: str) -> str:
+    """Filename-safe cache key for an endpoint, limited to 200 characters."""
+    return endpoint.translate(_ENDPOINT_TRANSLATE)[:200]
+
+
+class ChessComConnector(ConnectorMixin):
     """
     Chess.com API connector.
 
@@ -65,13 +131,38 @@ class ChessComConnector:
             "Accept": "application/json",
         })
 
-        # Rate limiting
-        self._last_request_time: float = 0
-
-        # Cache setup
+        # Pooled keep-alive connections, with transient failures retried by
+        # urllib3 using exponential backoff and the server's Retry-After
+        retry = Retry(
+            total=self.config.max_retries,
+            backoff_factor=self.config.retry_delay,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Rate limiting: token bucket refilled at one token per
+        # min_request_interval, starting full so short bursts go out at once
+        self._rate_lock = threading.Lock()
+        self._tokens: float = float(self.config.burst_capacity)
+        self._last_refill: float = time.monotonic()
+
+        # Cache setup. New entries are held in memory as (monotonic save
+        # time, data, encoded file) and written out in batches.
         self._cache_dir: Optional[Path] = None
+        self._cache_lock = threading.Lock()
+        self._dirty: Dict[str, Tuple[float, Any, bytes]] = {}
+        self._last_flush: float = time.monotonic()
         if self.config.cache_enabled:
             self._setup_cache()
+            # Flush whatever is still pending when the connector is
+            # collected or the interpreter exits, whichever comes first
+            weakref.finalize(
+                self, _write_cache_entries, self._cache_dir, self._cache_lock, self._dirty
+            )
 
     @property
     def platform_id(self) -> str:
@@ -104,63 +195,97 @@ class ChessComConnector:
 
     def _get_cache_key(self, endpoint: str) -> str:
         """Generate cache key from endpoint."""
-        # Remove base URL and clean up for filename
-        clean = endpoint.replace("/", "_").replace("?", "_").replace("&", "_")
-        return clean[:200]  # Limit length
+        return _endpoint_cache_key(endpoint)
 
     def _load_from_cache(self, cache_key: str) -> Optional[Dict]:
         """Load data from cache if valid."""
         if not self._cache_dir:
             return None
 
-        cache_file = self._cache_dir / f"{cache_key}.json"
-        if not cache_file.exists():
-            return None
+        with self._cache_lock:
+            pending = self._dirty.get(cache_key)
+        if pending is not None and time.monotonic() - pending[0] <= self.config.cache_ttl:
+            logger.debug(f"Cache hit for {cache_key} (not yet written)")
+            return pending[1]
 
+        cache_file = self._cache_dir / f"{cache_key}{_CACHE_SUFFIX}"
         try:
-            with open(cache_file, "r") as f:
-                cached = json.load(f)
-
-            # Check TTL
-            cached_at = datetime.fromisoformat(cached.get("cached_at", ""))
-            if datetime.now() - cached_at > timedelta(seconds=self.config.cache_ttl):
+            # Check TTL against the file's modification time
+            if time.time() - cache_file.stat().st_mtime > self.config.cache_ttl:
                 logger.debug(f"Cache expired for {cache_key}")
                 return None
+        except FileNotFoundError:
+            return None
 
+        try:
+            # One read and one parse of the raw bytes, no text-mode decoding layer
+            data = json.loads(cache_file.read_bytes())
             logger.debug(f"Cache hit for {cache_key}")
-            return cached.get("data")
+            return data
 
         except Exception as e:
             logger.warning(f"Error reading cache: {e}")
             return None
 
-    def _save_to_cache(self, cache_key: str, data: Dict) -> None:
-        """Save data to cache."""
+    def _save_to_cache(self, cache_key: str, data: Dict, raw: Optional[bytes] = None) -> None:
+        """
+        Queue data for the on-disk cache.
+
+        The file is written by the next _flush_cache(), which runs at most
+        every _CACHE_FLUSH_INTERVAL seconds and at interpreter exit.
+
+        Args:
+            cache_key: Key from _get_cache_key()
+            data: Decoded response
+            raw: The response body ``data`` was decoded from. When given it
+                is written as-is instead of re-encoding ``data``.
+        """
         if not self._cache_dir:
             return
 
-        cache_file = self._cache_dir / f"{cache_key}.json"
         try:
-            with open(cache_file, "w") as f:
-                json.dump({
-                    "cached_at": datetime.now().isoformat(),
-                    "data": data,
-                }, f)
-            logger.debug(f"Cached {cache_key}")
+            payload = raw if raw is not None else _CACHE_ENCODER.encode(data).encode("utf-8")
         except Exception as e:
             logger.warning(f"Error saving to cache: {e}")
+            return
+
+        with self._cache_lock:
+            self._dirty[cache_key] = (time.monotonic(), data, payload)
+
+    def _maybe_flush(self) -> None:
+        """Write pending cache entries if the flush interval has passed."""
+        if time.monotonic() - self._last_flush > _CACHE_FLUSH_INTERVAL:
+            self._flush_cache()
+
+    def _flush_cache(self) -> None:
+        """Write all pending cache entries to disk."""
+        self._last_flush = time.monotonic()
+        _write_cache_entries(self._cache_dir, self._cache_lock, self._dirty)
 
     # =========================================================================
     # Rate Limiting
     # =========================================================================
 
     def _rate_limit(self) -> None:
-        """Ensure minimum interval between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.config.min_request_interval:
-            sleep_time = self.config.min_request_interval - elapsed
-            time.sleep(sleep_time)
-        self._last_request_time = time.time()
+        """Take a token from the bucket, waiting for one if it is empty."""
+        interval = self.config.min_request_interval
+        if interval <= 0:
+            return
+
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.config.burst_capacity,
+                self._tokens + (now - self._last_refill) / interval,
+            )
+            self._last_refill = now
+            # A negative balance reserves a future slot, so concurrent
+            # callers queue up instead of all waking at once
+            self._tokens -= 1
+            wait_time = -self._tokens * interval
+
+        if wait_time > 0:
+            time.sleep(wait_time)
 
     # =========================================================================
     # HTTP Requests
@@ -194,73 +319,46 @@ class ChessComConnector:
             if cached is not None:
                 return cached
 
-        # Make request with retries
-        last_error: Optional[Exception] = None
-
-        for attempt in range(self.config.max_retries + 1):
-            self._rate_limit()
+        # Retries and backoff happen in the session's adapter
+        self._rate_limit()
+        try:
+            response = self.session.get(url, timeout=self.config.timeout)
+        except requests.Timeout:
+            logger.warning(f"Request timeout for {endpoint}")
+            raise APIError("Request timeout", platform="chesscom", url=url) from None
+        except requests.RequestException as e:
+            logger.warning(f"Request failed: {e}")
+            raise APIError(str(e), platform="chesscom", url=url) from None
+
+        if response.status_code == 200:
+            # Parse the body once and cache those same bytes, rather than
+            # serializing a large monthly archive back to JSON
+            raw = response.content
+            data = json.loads(raw)
+            if use_cache:
+                self._save_to_cache(cache_key, data, raw)
+                self._maybe_flush()
+            return data
+
+        if response.status_code == 404:
+            logger.debug(f"Resource not found: {endpoint}")
+            return None
 
-            try:
-                response = self.session.get(
-                    url,
-                    timeout=self.config.timeout,
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    if use_cache:
-                        self._save_to_cache(cache_key, data)
-                    return data
-
-                elif response.status_code == 429:
-                    # Rate limited
-                    wait_time = self.config.retry_delay * (2 ** attempt)
-                    logger.warning(
-                        f"Rate limited by Chess.com. Waiting {wait_time:.1f}s "
-                        f"(attempt {attempt + 1}/{self.config.max_retries + 1})"
-                    )
-                    time.sleep(wait_time)
-                    continue
-
-                elif response.status_code == 404:
-                    logger.debug(f"Resource not found: {endpoint}")
-                    return None
-
-                else:
-                    logger.warning(
-                        f"HTTP {response.status_code} for {endpoint}"
-                    )
-                    last_error = APIError(
-                        f"HTTP {response.status_code}",
-                        platform="chesscom",
-                        status_code=response.status_code,
-                        url=url,
-                    )
-
-            except requests.Timeout:
-                logger.warning(f"Request timeout for {endpoint}")
-                last_error = APIError(
-                    "Request timeout",
-                    platform="chesscom",
-                    url=url,
-                )
-
-            except requests.RequestException as e:
-                logger.warning(f"Request failed: {e}")
-                last_error = APIError(
-                    str(e),
-                    platform="chesscom",
-                    url=url,
-                )
-
-            # Wait before retry
-            if attempt < self.config.max_retries:
-                time.sleep(self.config.retry_delay * (attempt + 1))
-
-        # All retries exhausted
-        if last_error:
-            raise last_error
-        raise APIError("Request failed", platform="chesscom", url=url)
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After", "")
+            RateLimitError.raise_expected(
+                platform="chesscom",
+                retry_after=int(retry_after) if retry_after.isdigit() else None,
+                url=url,
+            )
+
+        logger.warning(f"HTTP {response.status_code} for {endpoint}")
+        raise APIError(
+            f"HTTP {response.status_code}",
+            platform="chesscom",
+            status_code=response.status_code,
+            url=url,
+        )
 
     # =========================================================================
     # Public API Methods
@@ -373,19 +471,17 @@ class ChessComConnector:
             logger.warning(f"No game archives found for {username}")
             return
 
-        # Filter archives by date range
+        # Filter archives by date range, comparing months as year * 12 + month
+        start_ym = start_date.year * 12 + start_date.month
+        end_ym = end_date.year * 12 + end_date.month
         filtered_archives = []
         for archive_url in archives:
             try:
                 # URL format: .../games/{year}/{month}
-                parts = archive_url.rstrip("/").split("/")
+                parts = archive_url.rstrip("/").rsplit("/", 2)
                 year, month = int(parts[-2]), int(parts[-1])
-                archive_date = datetime(year, month, 1)
 
-                # Check if archive overlaps with date range
-                archive_end = datetime(year, month + 1, 1) if month < 12 else datetime(year + 1, 1, 1)
-
-                if archive_end >= start_date and archive_date <= end_date:
+                if start_ym <= year * 12 + month <= end_ym:
                     filtered_archives.append((year, month))
 
             except (ValueError, IndexError) as e:
@@ -397,62 +493,99 @@ class ChessComConnector:
 
         # Fetch and normalize games
         games_yielded = 0
+        skipped = ErrorCollector()
+        matches = game_filter.compile_predicate() if game_filter else None
         max_games = game_filter.max_games if game_filter else None
 
-        for year, month in filtered_archives:
-            if max_games and games_yielded >= max_games:
-                return
-
-            logger.debug(f"Fetching games for {year}/{month:02d}")
-            raw_games = self._get_games_for_month(username, year, month)
-
-            # Sort by end_time descending (newest first)
-            raw_games.sort(key=lambda g: g.get("end_time", 0), reverse=True)
+        # Raw end_time bounds, so games outside the range are dropped before
+        # they are normalized (played_at is derived from end_time)
+        start_ts = start_date.timestamp()
+        end_ts = end_date.timestamp()
+
+        # Months are fetched concurrently (the token bucket still spaces out
+        # the requests) but consumed newest-first, in order. At most
+        # fetch_concurrency months are in flight; the next one is requested
+        # as each is read, so memory and requests follow the consumer.
+        concurrency = self.config.fetch_concurrency
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        months = iter(filtered_archives)
+        in_flight = deque(
+            (year, month, executor.submit(self._get_games_for_month, username, year, month))
+            for year, month in islice(months, concurrency)
+        )
 
-            for raw_game in raw_games:
+        try:
+            while in_flight:
                 if max_games and games_yielded >= max_games:
                     return
 
-                try:
-                    normalized = self.normalizer.normalize_game(raw_game, username)
-
-                    # Apply date filter
-                    if normalized.played_at < start_date:
-                        continue
-                    if normalized.played_at > end_date:
+                year, month, future = in_flight.popleft()
+                for next_year, next_month in islice(months, 1):
+                    in_flight.append((
+                        next_year,
+                        next_month,
+                        executor.submit(self._get_games_for_month, username, next_year, next_month),
+                    ))
+
+                logger.debug(f"Reading games for {year}/{month:02d}")
+                raw_games = future.result()
+
+                # Sort by end_time descending (newest first). Archives arrive
+                # oldest first, which timsort handles as a single run.
+                raw_games.sort(key=_END_TIME_KEY, reverse=True)
+
+                for raw_game in raw_games:
+                    if max_games and games_yielded >= max_games:
+                        return
+
+                    end_time = raw_game.get("end_time")
+                    if end_time:
+                        if end_time < start_ts:
+                            # Newest first, so the rest of the month is older still
+                            break
+                        if end_time > end_ts:
+                            continue
+
+                    try:
+                        normalized = self.normalizer.normalize_game(raw_game, username, skipped)
+                        if normalized is None:
+                            continue
+
+                        # Apply date filter
+                        if normalized.played_at < start_date:
+                            continue
+                        if normalized.played_at > end_date:
+                            continue
+
+                        # Apply game filter
+                        if matches and not matches(normalized):
+                            continue
+
+                        yield normalized
+                        games_yielded += 1
+
+                    except NormalizationError as e:
+                        logger.warning(f"Skipping game due to normalization error: {e}")
                         continue
-
-                    # Apply game filter
-                    if game_filter and not game_filter.matches(normalized):
+                    except Exception as e:
+                        logger.warning(f"Unexpected error processing game: {e}")
                         continue
-
-                    yield normalized
-                    games_yielded += 1
-
-                except NormalizationError as e:
-                    logger.warning(f"Skipping game due to normalization error: {e}")
-                    continue
-                except Exception as e:
-                    logger.warning(f"Unexpected error processing game: {e}")
-                    continue
-
+        finally:
+            # Stop months nobody will read once max_games is reached
+            for _, _, future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        if skipped:
+            logger.warning(
+                f"Skipped {len(skipped)} games due to normalization errors (first: {skipped.first})"
+            )
+            # Building every error is only worth it when someone will read them
+            if logger.isEnabledFor(logging.DEBUG):
+                for error in skipped.errors:
+                    logger.debug(f"Skipped game due to normalization error: {error}")
         logger.info(f"Yielded {games_yielded} games for {username}")
 
-    def get_games_list(
-        self,
-        username: str,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        game_filter: Optional[GameFilter] = None,
-    ) -> List[NormalizedGame]:
-        """
-        Fetch games as a list (convenience method).
-
-        Same as get_games() but returns a list instead of iterator.
-        Use get_games() for large datasets to avoid memory issues.
-        """
-        return list(self.get_games(username, start_date, end_date, game_filter))
-
     def get_current_games(self, username: str) -> List[Dict[str, Any]]:
         """
         Get currently active daily games.
@@ -11,7 +11,8 @@ This module handles:
 - Result parsing
 """
 
-from typing import Dict, Tuple, Optional, Set
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Optional, Set
 import re
 
 from src.core.constants import (
@@ -23,14 +24,30 @@ from src.core.constants import (
 )
 
 
+def _get_lowercase(table: Dict[str, Any], key: str, default: Any = None) -> Any:
+    """
+    Look up a key in a table with lowercase keys.
+
+    The API already sends lowercase values, so the key is only lowercased
+    when the exact lookup misses.
+    """
+    value = table.get(key)
+    if value is None and key:
+        value = table.get(key.lower())
+    return default if value is None else value
+
+
 # =============================================================================
 # Time Control Parsing
 # =============================================================================
 
+@lru_cache(maxsize=256)
 def parse_time_control(time_control_str: str) -> Tuple[int, int, TimeClass]:
     """
     Parse Chess.com time control string to normalized format.
 
+    Memoized: a player's archive only uses a handful of distinct strings.
+
     Chess.com formats:
     - "180" (3 minutes, no increment)
     - "180+2" (3 minutes + 2 second increment)
@@ -87,10 +104,7 @@ CHESSCOM_TIME_CLASS_MAP: Dict[str, TimeClass] = {
 
 def map_time_class(chesscom_time_class: str) -> TimeClass:
     """Map Chess.com time_class string to normalized TimeClass."""
-    return CHESSCOM_TIME_CLASS_MAP.get(
-        chesscom_time_class.lower(),
-        TimeClass.UNKNOWN
-    )
+    return _get_lowercase(CHESSCOM_TIME_CLASS_MAP, chesscom_time_class, TimeClass.UNKNOWN)
 
 
 # =============================================================================
@@ -110,6 +124,26 @@ CHESSCOM_VARIANT_MAP: Dict[str, GameVariant] = {
     "oddschess": GameVariant.OTHER,
 }
 
+# Any variant key inside a PGN header, longest first so "chess960" wins
+# over its prefix "chess"
+_VARIANT_HEADER_RE = re.compile(
+    "|".join(re.escape(key) for key in sorted(CHESSCOM_VARIANT_MAP, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+# Variant markers in Chess.com game URLs
+_URL_VARIANT_MAP: Dict[str, GameVariant] = {
+    "chess960": GameVariant.CHESS960,
+    "/960/": GameVariant.CHESS960,
+    "crazyhouse": GameVariant.CRAZYHOUSE,
+    "kingofthehill": GameVariant.KING_OF_THE_HILL,
+    "3check": GameVariant.THREE_CHECK,
+    "threecheck": GameVariant.THREE_CHECK,
+}
+_URL_VARIANT_RE = re.compile(
+    "|".join(re.escape(key) for key in _URL_VARIANT_MAP), re.IGNORECASE
+)
+
 
 def detect_variant(
     game_url: str = "",
@@ -138,32 +172,33 @@ def detect_variant(
     if game_data:
         rules = game_data.get("rules", "")
         if rules:
-            variant = CHESSCOM_VARIANT_MAP.get(rules.lower())
+            variant = _get_lowercase(CHESSCOM_VARIANT_MAP, rules)
             if variant:
                 return variant
 
     # Check URL patterns
-    url_lower = game_url.lower()
-    if "chess960" in url_lower or "/960/" in url_lower:
-        return GameVariant.CHESS960
-    if "crazyhouse" in url_lower:
-        return GameVariant.CRAZYHOUSE
-    if "kingofthehill" in url_lower:
-        return GameVariant.KING_OF_THE_HILL
-    if "3check" in url_lower or "threecheck" in url_lower:
-        return GameVariant.THREE_CHECK
+    match = _URL_VARIANT_RE.search(game_url) if game_url else None
+    if match:
+        return _URL_VARIANT_MAP[match.group(0).lower()]
 
     # Check PGN headers
-    for header in [variant_header, rules_header]:
-        if header:
-            header_lower = header.lower()
-            for key, variant in CHESSCOM_VARIANT_MAP.items():
-                if key in header_lower:
-                    return variant
+    for header in (variant_header, rules_header):
+        match = _VARIANT_HEADER_RE.search(header) if header else None
+        if match:
+            return CHESSCOM_VARIANT_MAP[match.group(0).lower()]
 
     return GameVariant.STANDARD
 
 
+# Rules values naming Chess960
+_CHESS960_RULES = {"chess960": True, "fischerrandom": True}
+
+# Variant/Rules header naming Chess960, matched case-insensitively
+_CHESS960_HEADER_RE = re.compile(
+    r'\[(?:variant|rules) "(?:chess960|fischerrandom)"\]', re.IGNORECASE
+)
+
+
 def is_chess960(game_data: Dict, pgn: str = "") -> bool:
     """
     Specifically check if a game is Chess960.
@@ -179,7 +214,7 @@ def is_chess960(game_data: Dict, pgn: str = "") -> bool:
     """
     # Check rules field
     rules = game_data.get("rules", "")
-    if rules.lower() in ("chess960", "fischerrandom"):
+    if rules and _get_lowercase(_CHESS960_RULES, rules, False):
         return True
 
     # Check URL
@@ -188,12 +223,8 @@ def is_chess960(game_data: Dict, pgn: str = "") -> bool:
         return True
 
     # Check PGN headers
-    if pgn:
-        pgn_lower = pgn.lower()
-        if '[variant "chess960"]' in pgn_lower:
-            return True
-        if '[rules "chess960"]' in pgn_lower or '[rules "fischerrandom"]' in pgn_lower:
-            return True
+    if pgn and _CHESS960_HEADER_RE.search(pgn):
+        return True
 
     return False
 
@@ -230,6 +261,65 @@ CHESSCOM_TERMINATION_MAP: Dict[str, TerminationReason] = {
     "bughousepartnerlose": TerminationReason.OTHER,  # Bughouse
 }
 
+# Result strings that mean the game was drawn
+_DRAW_RESULTS = frozenset(("agreed", "repetition", "stalemate", "insufficient", "50move"))
+
+# Result string -> (termination reason, is draw), built once
+_RESULT_INFO: Dict[str, Tuple[TerminationReason, bool]] = {
+    key: (reason, key in _DRAW_RESULTS)
+    for key, reason in CHESSCOM_TERMINATION_MAP.items()
+}
+_WIN_INFO = _RESULT_INFO["win"]
+_UNKNOWN_RESULT_INFO = (TerminationReason.UNKNOWN, False)
+
+
+def _result_info(result: str) -> Tuple[TerminationReason, bool]:
+    """Look up a result string's (termination reason, is draw) entry."""
+    return _get_lowercase(_RESULT_INFO, result, _UNKNOWN_RESULT_INFO)
+
+
+def _termination_outcome(
+    white_result: str,
+    black_result: str,
+) -> Tuple[TerminationReason, Optional[PlayerColor]]:
+    """Work out the termination reason and winner from both result strings."""
+    white_info = _result_info(white_result)
+    black_info = _result_info(black_result)
+
+    # Handle draws (both sides carry the same draw result)
+    if white_info[1]:
+        return white_info[0], None
+
+    # Determine winner
+    winner: Optional[PlayerColor] = None
+    if white_info is _WIN_INFO:
+        winner = PlayerColor.WHITE
+    elif black_info is _WIN_INFO:
+        winner = PlayerColor.BLACK
+
+    # Determine termination reason (from loser's result)
+    termination = black_info[0] if winner is PlayerColor.WHITE else white_info[0]
+    return termination, winner
+
+
+# Outcome of every pair of known (lowercase) result strings, built once
+_TERMINATION_DISPATCH: Dict[Tuple[str, str], Tuple[TerminationReason, Optional[PlayerColor]]] = {
+    (white, black): _termination_outcome(white, black)
+    for white in (*CHESSCOM_TERMINATION_MAP, "")
+    for black in (*CHESSCOM_TERMINATION_MAP, "")
+}
+
+# Game result for (winner, player color)
+_RESULT_FROM_POV: Dict[Tuple[Optional[PlayerColor], PlayerColor], GameResult] = {
+    (winner, player): (
+        GameResult.DRAW if winner is None
+        else GameResult.WIN if winner is player
+        else GameResult.LOSS
+    )
+    for winner in (None, PlayerColor.WHITE, PlayerColor.BLACK)
+    for player in (PlayerColor.WHITE, PlayerColor.BLACK)
+}
+
 
 def parse_termination(
     white_result: str,
@@ -251,38 +341,13 @@ def parse_termination(
     Returns:
         Tuple of (TerminationReason, GameResult, winner_color or None)
     """
-    white_result_lower = white_result.lower() if white_result else ""
-    black_result_lower = black_result.lower() if black_result else ""
+    # Known lowercase pairs are precomputed; anything else is resolved here
+    outcome = _TERMINATION_DISPATCH.get((white_result, black_result))
+    if outcome is None:
+        outcome = _termination_outcome(white_result, black_result)
 
-    # Determine winner
-    winner: Optional[PlayerColor] = None
-    if white_result_lower == "win" or black_result_lower in CHESSCOM_TERMINATION_MAP:
-        if "win" in white_result_lower:
-            winner = PlayerColor.WHITE
-        elif "win" in black_result_lower:
-            winner = PlayerColor.BLACK
-
-    # Determine termination reason (from loser's result)
-    loser_result = black_result_lower if winner == PlayerColor.WHITE else white_result_lower
-    termination = CHESSCOM_TERMINATION_MAP.get(
-        loser_result,
-        TerminationReason.UNKNOWN
-    )
-
-    # Handle draws
-    if white_result_lower in ("agreed", "repetition", "stalemate", "insufficient", "50move"):
-        winner = None
-        termination = CHESSCOM_TERMINATION_MAP.get(white_result_lower, TerminationReason.AGREEMENT)
-
-    # Determine result from player's perspective
-    if winner is None:
-        result = GameResult.DRAW
-    elif winner == player_color:
-        result = GameResult.WIN
-    else:
-        result = GameResult.LOSS
-
-    return termination, result, winner
+    termination, winner = outcome
+    return termination, _RESULT_FROM_POV[winner, player_color], winner
 
 
 # =============================================================================
@@ -324,6 +389,13 @@ def is_daily_game(game_data: Dict) -> bool:
 # Opening Extraction
 # =============================================================================
 
+# Opening slug at the end of a Chess.com ECO URL
+_OPENING_URL_RE = re.compile(r'/openings/([^/]+)$')
+
+# Start of the move sequence in an opening slug, e.g. "-2.Nf3"
+_MOVE_SPLIT_RE = re.compile(r'-\d+\.')
+
+
 def extract_opening_from_url(eco_url: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Extract opening name and ECO code from Chess.com ECO URL.
@@ -342,7 +414,7 @@ def extract_opening_from_url(eco_url: str) -> Tuple[Optional[str], Optional[str]
     try:
         # Extract the opening part from URL
         # Format: /openings/Opening-Name-With-Moves
-        match = re.search(r'/openings/([^/]+)$', eco_url)
+        match = _OPENING_URL_RE.search(eco_url)
         if not match:
             return None, None
 
@@ -350,7 +422,7 @@ def extract_opening_from_url(eco_url: str) -> Tuple[Optional[str], Optional[str]
 
         # Remove move sequence (everything after the main opening name that looks like moves)
         # Moves typically start with numbers: "2.Nf3", "3.d4", etc.
-        opening_name = re.split(r'-\d+\.', opening_path)[0]
+        opening_name = _MOVE_SPLIT_RE.split(opening_path, maxsplit=1)[0]
 
         # Replace dashes with spaces
         opening_name = opening_name.replace('-', ' ')
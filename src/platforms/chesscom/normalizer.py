@@ -25,7 +25,7 @@ from src.core.schemas import (
     TimeControl,
     Opening,
 )
-from src.core.exceptions import NormalizationError, MissingDataError
+from src.core.exceptions import NormalizationError, MissingDataError, ErrorCollector
 
 from .game_types import (
     parse_time_control,
@@ -40,6 +40,37 @@ from .game_types import (
 
 logger = logging.getLogger(__name__)
 
+# PGN tag pair: [Name "value"]
+_PGN_HEADER_RE = re.compile(r'\[(\w+)\s+"([^"]+)"\]')
+
+# First blank line, which ends the PGN header block
+_BLANK_LINE_RE = re.compile(r'(?:^|\n)[ \t\r]*\n')
+
+# One pass over move text: {comments}, $NAG annotations, move numbers and
+# further tag-pair lines match without a group; anything else is a move
+_MOVE_TOKEN_RE = re.compile(
+    r'\{[^}]*\}|\$\d+|\d+\.+|^[ \t]*\[[^\n]*|([^\s{$]+)',
+    re.MULTILINE,
+)
+
+_RESULT_TOKENS = frozenset(("1-0", "0-1", "1/2-1/2", "*"))
+
+
+def _parse_pgn_headers(pgn: str) -> Dict[str, str]:
+    """
+    Read all tag pairs from a PGN in one pass.
+
+    Only the header block (up to the first blank line) is scanned. Names
+    are lowercased for case-insensitive lookup; the first occurrence wins.
+    """
+    end = pgn.find("\n\n")
+    header_block = pgn if end < 0 else pgn[:end]
+
+    headers: Dict[str, str] = {}
+    for name, value in _PGN_HEADER_RE.findall(header_block):
+        headers.setdefault(name.lower(), value)
+    return headers
+
 
 class ChessComNormalizer:
     """
@@ -56,16 +87,19 @@ class ChessComNormalizer:
         self,
         raw_game: Dict[str, Any],
         player_username: str,
-    ) -> NormalizedGame:
+        collector: Optional[ErrorCollector] = None,
+    ) -> Optional[NormalizedGame]:
         """
         Convert Chess.com game data to NormalizedGame.
 
         Args:
             raw_game: Raw game data from Chess.com API
             player_username: Username of the player we're analyzing
+            collector: Optional collector for bulk runs; expected data
+                problems are recorded there instead of raised
 
         Returns:
-            NormalizedGame instance
+            NormalizedGame instance, or None if an error was recorded
 
         Raises:
             NormalizationError: If game data cannot be normalized
@@ -77,6 +111,9 @@ class ChessComNormalizer:
                 # Fall back to URL-based ID
                 game_id = raw_game.get("url", "").split("/")[-1]
             if not game_id:
+                if collector is not None:
+                    collector.record(MissingDataError, "game_id", platform="chesscom")
+                    return None
                 raise MissingDataError("game_id", platform="chesscom")
 
             url = raw_game.get("url", "")
@@ -117,6 +154,14 @@ class ChessComNormalizer:
             elif black.username.lower() == player_lower:
                 player_color = PlayerColor.BLACK
             else:
+                if collector is not None:
+                    collector.record(
+                        NormalizationError,
+                        f"Player '{player_username}' not found in game",
+                        platform="chesscom",
+                        field="player_username",
+                    )
+                    return None
                 raise NormalizationError(
                     f"Player '{player_username}' not found in game",
                     platform="chesscom",
@@ -226,8 +271,9 @@ class ChessComNormalizer:
 
         # Try to extract from PGN headers
         if pgn:
-            opening_name = self._extract_pgn_header(pgn, "Opening")
-            eco_code = self._extract_pgn_header(pgn, "ECO")
+            headers = _parse_pgn_headers(pgn)
+            opening_name = headers.get("opening")
+            eco_code = headers.get("eco")
 
             if opening_name:
                 return Opening(
@@ -237,60 +283,26 @@ class ChessComNormalizer:
 
         return None
 
-    def _extract_pgn_header(self, pgn: str, header_name: str) -> Optional[str]:
-        """Extract a header value from PGN."""
-        pattern = rf'\[{header_name}\s+"([^"]+)"\]'
-        match = re.search(pattern, pgn, re.IGNORECASE)
-        if match:
-            return match.group(1)
-        return None
-
     def _extract_moves_from_pgn(self, pgn: str) -> List[str]:
         """Extract move list from PGN."""
         if not pgn:
             return []
 
         try:
-            # Find the move section (after headers)
-            # Headers are in format [Header "value"]
-            lines = pgn.split("\n")
-            move_lines = []
-
-            in_moves = False
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    in_moves = True
-                    continue
-                if in_moves and not line.startswith("["):
-                    move_lines.append(line)
-
-            move_text = " ".join(move_lines)
-
-            # Remove comments {comment}
-            move_text = re.sub(r'\{[^}]*\}', '', move_text)
-
-            # Remove annotations like $1, $2
-            move_text = re.sub(r'\$\d+', '', move_text)
+            # The move section starts after the first blank line
+            header_end = _BLANK_LINE_RE.search(pgn)
+            if not header_end:
+                return []
+
+            # Extract moves (format: 1. e4 e5 2. Nf3 Nc6) in a single scan
+            moves = [
+                token for token in _MOVE_TOKEN_RE.findall(pgn, header_end.end())
+                if token and not token.endswith('.')
+            ]
 
             # Remove result at end
-            move_text = re.sub(r'\s*(1-0|0-1|1/2-1/2|\*)\s*$', '', move_text)
-
-            # Extract moves (format: 1. e4 e5 2. Nf3 Nc6)
-            # Split on move numbers
-            moves = []
-            parts = re.split(r'\d+\.+\s*', move_text)
-
-            for part in parts:
-                part = part.strip()
-                if not part:
-                    continue
-                # Each part may have one or two moves (white and black)
-                move_parts = part.split()
-                for move in move_parts:
-                    move = move.strip()
-                    if move and not move.endswith('.'):
-                        moves.append(move)
+            if moves and moves[-1] in _RESULT_TOKENS:
+                moves.pop()
 
             return moves
 
@@ -15,6 +15,7 @@ from typing import Dict, Any, Optional, List, Iterator
 import requests
 
 from src.core.constants import Platform, TimeClass
+from src.core.protocols import ConnectorMixin
 from src.core.schemas import (
     NormalizedGame,
     PlayerProfile,
@@ -26,6 +27,7 @@ from src.core.exceptions import (
     UserNotFoundError,
     AuthenticationError,
     NormalizationError,
+    ErrorCollector,
 )
 
 from .config import LichessConfig, DEFAULT_CONFIG
@@ -34,7 +36,7 @@ from .normalizer import LichessNormalizer
 logger = logging.getLogger(__name__)
 
 
-class LichessConnector:
+class LichessConnector(ConnectorMixin):
     """
     Lichess API connector.
 
@@ -308,7 +310,7 @@ class LichessConnector:
                 )
 
             if response.status_code == 429:
-                raise RateLimitError(platform="lichess")
+                RateLimitError.raise_expected(platform="lichess")
 
             if response.status_code == 404:
                 return
@@ -453,6 +455,8 @@ class LichessConnector:
         # Stream games
         endpoint = f"/games/user/{username}"
         games_yielded = 0
+        skipped = ErrorCollector()
+        matches = game_filter.compile_predicate() if game_filter else None
 
         logger.info(f"Fetching Lichess games for {username}")
 
@@ -461,10 +465,12 @@ class LichessConnector:
                 return
 
             try:
-                normalized = self.normalizer.normalize_game(raw_game, username)
+                normalized = self.normalizer.normalize_game(raw_game, username, skipped)
+                if normalized is None:
+                    continue
 
                 # Apply additional filters not supported by API
-                if game_filter and not game_filter.matches(normalized):
+                if matches and not matches(normalized):
                     continue
 
                 yield normalized
@@ -477,22 +483,16 @@ class LichessConnector:
                 logger.warning(f"Unexpected error processing game: {e}")
                 continue
 
+        if skipped:
+            logger.warning(
+                f"Skipped {len(skipped)} games due to normalization errors (first: {skipped.first})"
+            )
+            # Building every error is only worth it when someone will read them
+            if logger.isEnabledFor(logging.DEBUG):
+                for error in skipped.errors:
+                    logger.debug(f"Skipped game due to normalization error: {error}")
         logger.info(f"Yielded {games_yielded} games for {username}")
 
-    def get_games_list(
-        self,
-        username: str,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        game_filter: Optional[GameFilter] = None,
-    ) -> List[NormalizedGame]:
-        """
-        Fetch games as a list (convenience method).
-
-        Same as get_games() but returns a list instead of iterator.
-        """
-        return list(self.get_games(username, start_date, end_date, game_filter))
-
     def get_current_games(self, username: str) -> List[Dict[str, Any]]:
         """
         Get currently active games.
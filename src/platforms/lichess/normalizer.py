@@ -24,7 +24,7 @@ from src.core.schemas import (
     TimeControl,
     Opening,
 )
-from src.core.exceptions import NormalizationError, MissingDataError
+from src.core.exceptions import NormalizationError, MissingDataError, ErrorCollector
 
 from .game_types import (
     parse_time_control,
@@ -60,7 +60,8 @@ class LichessNormalizer:
         self,
         raw_game: Dict[str, Any],
         player_username: str,
-    ) -> NormalizedGame:
+        collector: Optional[ErrorCollector] = None,
+    ) -> Optional[NormalizedGame]:
         """
         Convert Lichess game data to NormalizedGame.
 
@@ -87,9 +88,11 @@ class LichessNormalizer:
         Args:
             raw_game: Raw game data from Lichess API
             player_username: Username of the player we're analyzing
+            collector: Optional collector for bulk runs; expected data
+                problems are recorded there instead of raised
 
         Returns:
-            NormalizedGame instance
+            NormalizedGame instance, or None if an error was recorded
 
         Raises:
             NormalizationError: If game data cannot be normalized
@@ -98,6 +101,9 @@ class LichessNormalizer:
             # Required fields
             game_id = raw_game.get("id")
             if not game_id:
+                if collector is not None:
+                    collector.record(MissingDataError, "id", platform="lichess")
+                    return None
                 raise MissingDataError("id", platform="lichess")
 
             # Build URL
@@ -136,6 +142,14 @@ class LichessNormalizer:
             elif black.username.lower() == player_lower:
                 player_color = PlayerColor.BLACK
             else:
+                if collector is not None:
+                    collector.record(
+                        NormalizationError,
+                        f"Player '{player_username}' not found in game",
+                        platform="lichess",
+                        field="player_username",
+                    )
+                    return None
                 raise NormalizationError(
                     f"Player '{player_username}' not found in game",
                     platform="lichess",
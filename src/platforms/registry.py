@@ -98,7 +98,7 @@ def get_connector(
         raise PlatformNotSupportedError(
             platform=platform_id,
             supported_platforms=list(_CONNECTOR_REGISTRY.keys()),
-            details={"import_error": str(e)},
+            import_error=str(e),
         )
 
 
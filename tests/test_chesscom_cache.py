@@ -0,0 +1,45 @@
+"""
+Tests for the Chess.com connector's on-disk response cache.
+"""
+
+import gc
+import os
+import sys
+import weakref
+
+import pytest
+
+pytest.importorskip("requests")
+
+# Add project root to path for imports
+project_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.platforms.chesscom.config import ChessComConfig
+from src.platforms.chesscom.connector import ChessComConnector
+
+
+def test_pending_entries_flush_when_connector_is_collected(tmp_path):
+    """The exit-time flush doesn't keep the connector alive, and still runs."""
+    connector = ChessComConnector(ChessComConfig(cache_dir=str(tmp_path)))
+    connector._save_to_cache("player_bob", {"username": "bob"})
+    assert not list(tmp_path.iterdir())
+
+    ref = weakref.ref(connector)
+    del connector
+    gc.collect()
+
+    assert ref() is None
+    assert (tmp_path / "player_bob.body.json").read_bytes() == b'{"username":"bob"}'
+
+
+def test_pending_entries_are_served_before_flush(tmp_path):
+    """Queued entries are readable straight away and written on flush."""
+    connector = ChessComConnector(ChessComConfig(cache_dir=str(tmp_path)))
+    connector._save_to_cache("player_bob", {"username": "bob"}, raw=b'{"username": "bob"}')
+    assert connector._load_from_cache("player_bob") == {"username": "bob"}
+
+    connector._flush_cache()
+    assert (tmp_path / "player_bob.body.json").read_bytes() == b'{"username": "bob"}'
+    assert connector._load_from_cache("player_bob") == {"username": "bob"}
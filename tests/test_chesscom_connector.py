@@ -0,0 +1,111 @@
+"""
+Tests for Chess.com connector game fetching, with the HTTP layer stubbed.
+"""
+
+import logging
+import os
+import sys
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("requests")
+
+# Add project root to path for imports
+project_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.constants import Platform, GameResult, TerminationReason, TimeClass
+from src.core.exceptions import NormalizationError
+from src.core.schemas import GameFilter, NormalizedGame, PlayerInfo, TimeControl
+from src.platforms.chesscom.config import ChessComConfig
+from src.platforms.chesscom.connector import ChessComConnector
+
+MONTHS = 12
+
+
+def make_connector(requested):
+    """Connector with MONTHS monthly archives, one game each, and no network."""
+    connector = ChessComConnector(ChessComConfig(cache_enabled=False, default_months_back=MONTHS * 31))
+    now = datetime.now()
+    archives = []
+    year, month = now.year, now.month
+    for _ in range(MONTHS):
+        archives.append(f"https://api.chess.com/pub/player/alice/games/{year}/{month:02d}")
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+    lock = threading.Lock()
+
+    def get_games_for_month(username, year, month):
+        with lock:
+            requested.append((year, month))
+        return [{"month": (year, month)}]
+
+    def normalize_game(raw_game, username, collector=None):
+        year, month = raw_game["month"]
+        return NormalizedGame(
+            game_id=f"{year}-{month}",
+            platform=Platform.CHESS_COM,
+            url="",
+            played_at=now - timedelta(days=1),
+            time_control=TimeControl(300, 0, TimeClass.BLITZ),
+            white=PlayerInfo("alice", 1500),
+            black=PlayerInfo("bob", 1500),
+            player_username="alice",
+            result=GameResult.WIN,
+            termination=TerminationReason.CHECKMATE,
+        )
+
+    connector._get_archives = lambda username: archives
+    connector._get_games_for_month = get_games_for_month
+    connector.normalizer.normalize_game = normalize_game
+    return connector
+
+
+def test_months_are_read_newest_first():
+    """Every month in range is read, in newest-first order."""
+    requested = []
+    games = list(make_connector(requested).get_games("alice"))
+    ids = [game.game_id for game in games]
+    assert len(ids) == MONTHS
+    assert ids == sorted(ids, key=lambda i: tuple(map(int, i.split("-"))), reverse=True)
+    assert len(requested) == MONTHS
+
+
+def test_max_games_bounds_requests():
+    """Only the months being read, plus the in-flight window, are requested."""
+    requested = []
+    connector = make_connector(requested)
+    games = list(connector.get_games("alice", game_filter=GameFilter(max_games=2)))
+    assert len(games) == 2
+    assert len(requested) <= 2 + connector.config.fetch_concurrency
+
+
+def test_lazy_consumer_bounds_requests():
+    """A generator that isn't advanced doesn't fetch the whole range."""
+    requested = []
+    connector = make_connector(requested)
+    games = connector.get_games("alice")
+    next(games)
+    assert len(requested) <= 1 + connector.config.fetch_concurrency
+    games.close()
+
+
+def test_skipped_games_are_logged_with_reasons(caplog):
+    """Recorded normalization errors are reported, not just counted."""
+    requested = []
+    connector = make_connector(requested)
+
+    def normalize_game(raw_game, username, collector=None):
+        collector.record(NormalizationError, "Bad game", platform="chesscom", field="end_time")
+        return None
+
+    connector.normalizer.normalize_game = normalize_game
+    with caplog.at_level(logging.DEBUG, logger="src.platforms.chesscom.connector"):
+        assert list(connector.get_games("alice")) == []
+
+    warnings = [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING]
+    assert any(f"Skipped {MONTHS} games" in m and "Field: end_time" in m for m in warnings)
+    debug = [r.getMessage() for r in caplog.records if r.levelno == logging.DEBUG and "Bad game" in r.getMessage()]
+    assert len(debug) == MONTHS
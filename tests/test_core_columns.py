@@ -0,0 +1,102 @@
+"""
+Tests for the columnar game and profile views.
+"""
+
+import math
+import os
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Add project root to path for imports
+project_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.columns import games_to_columns, profile_stats
+from src.core.constants import Platform, GameResult, TerminationReason, TimeClass
+from src.core.schemas import NormalizedGame, PlayerInfo, PlayerProfile, TimeControl
+
+
+def make_game(player_rating=1500, opponent_rating=1600, player_is_white=True,
+              result=GameResult.WIN, moves=("e4", "e5"), accuracy=None):
+    """Build a game analyzed from 'alice', with the given details."""
+    player = PlayerInfo("alice", player_rating)
+    opponent = PlayerInfo("bob", opponent_rating)
+    white, black = (player, opponent) if player_is_white else (opponent, player)
+    return NormalizedGame(
+        game_id="1",
+        platform=Platform.CHESS_COM,
+        url="https://www.chess.com/game/live/1",
+        played_at=datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc),
+        time_control=TimeControl(300, 0, TimeClass.BLITZ),
+        white=white,
+        black=black,
+        player_username="alice",
+        result=result,
+        termination=TerminationReason.CHECKMATE,
+        moves_san=list(moves),
+        accuracy=accuracy,
+    )
+
+
+def test_games_to_columns_matches_games():
+    """Every column agrees with the per-game attributes, in order."""
+    games = [
+        make_game(accuracy=91.5),
+        make_game(1520, 1480, player_is_white=False, result=GameResult.DRAW, moves=("d4",)),
+        make_game(result=GameResult.LOSS, moves=()),
+    ]
+    columns = games_to_columns(games)
+
+    assert {len(column) for column in columns.values()} == {3}
+    assert columns["player_rating"].tolist() == [g.player_rating for g in games]
+    assert columns["opponent_rating"].tolist() == [g.opponent_rating for g in games]
+    assert columns["player_is_white"].tolist() == [True, False, True]
+    assert columns["score"].tolist() == [1.0, 0.5, 0.0]
+    assert columns["total_moves"].tolist() == [2, 1, 0]
+    assert columns["played_at"][0] == games[0].played_at.timestamp()
+    assert columns["accuracy"][0] == pytest.approx(91.5)
+    assert np.isnan(columns["accuracy"][1:]).all()
+
+
+def test_games_to_columns_missing_rating():
+    """A missing rating becomes NaN instead of failing the whole batch."""
+    columns = games_to_columns([make_game(player_rating=None), make_game()])
+    assert np.isnan(columns["player_rating"][0])
+    assert columns["player_rating"][1] == 1500
+    assert columns["opponent_rating"].tolist() == [1600, 1600]
+
+
+def test_games_to_columns_empty():
+    """An empty batch gives empty columns of every name."""
+    columns = games_to_columns([])
+    assert "player_rating" in columns
+    assert all(len(column) == 0 for column in columns.values())
+
+
+def test_profile_stats_matches_profiles():
+    """Vectorized rates agree with PlayerProfile's own, including no games."""
+    profiles = [
+        PlayerProfile("a", Platform.CHESS_COM, "", total_games=10, wins=5, draws=2, losses=3),
+        PlayerProfile("b", Platform.LICHESS, "", total_games=3, wins=1, draws=1, losses=1),
+        PlayerProfile("c", Platform.CHESS_COM, ""),
+    ]
+    stats = profile_stats(profiles)
+
+    assert stats["total_games"].tolist() == [10, 3, 0]
+    for i, profile in enumerate(profiles):
+        assert stats["win_rate"][i] == pytest.approx(profile.win_rate)
+        assert stats["draw_rate"][i] == pytest.approx(profile.draw_rate)
+        expected_loss_rate = profile.losses / profile.total_games * 100 if profile.total_games else 0.0
+        assert stats["loss_rate"][i] == pytest.approx(expected_loss_rate)
+    assert not any(math.isnan(rate) for rate in stats["win_rate"])
+
+
+def test_profile_stats_empty():
+    """An empty batch gives empty arrays rather than dividing by zero."""
+    stats = profile_stats([])
+    assert all(len(values) == 0 for values in stats.values())
@@ -0,0 +1,161 @@
+"""
+Tests for the core exception hierarchy.
+
+These only need the standard library, so they run without the
+analysis dependencies installed.
+"""
+
+import os
+import pickle
+import sys
+
+# Add project root to path for imports
+project_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.exceptions import (
+    ChessAnalysisError,
+    NormalizationError,
+    APIError,
+    RateLimitError,
+    InsufficientDataError,
+    UserNotFoundError,
+    ModelNotSupportedError,
+    MissingDataError,
+    ErrorCollector,
+)
+
+
+def test_base_error_includes_details():
+    """Details are appended to the message when present."""
+    error = ChessAnalysisError("Something failed", game_id="abc")
+    assert str(error) == "Something failed | Details: {'game_id': 'abc'}"
+    assert str(ChessAnalysisError("Plain")) == "Plain"
+
+
+def test_str_is_cached():
+    """The formatted string is built once and reused."""
+    error = RateLimitError(platform="lichess", retry_after=5)
+    first = str(error)
+    assert first == "Rate limit exceeded | Platform: lichess | Status: 429 | Retry after: 5s"
+    assert str(error) is first
+
+
+def test_subclass_formatting():
+    """Subclasses extend the base formatting with their own fields."""
+    error = NormalizationError("Bad value", platform="chesscom", field="rating", raw_value="x")
+    assert str(error) == "Bad value | Platform: chesscom | Field: rating | Value: 'x'"
+
+    error = InsufficientDataError(required_games=10, available_games=2)
+    assert str(error) == "Insufficient data for analysis | Required: 10, Available: 2"
+
+
+def test_constructed_messages():
+    """Optional parts are only included when provided."""
+    assert str(UserNotFoundError("bob")) == "User 'bob' not found"
+    assert str(UserNotFoundError("bob", platform="lichess")) == "User 'bob' not found on lichess"
+
+    error = ModelNotSupportedError("gpt-x", provider="openai", supported_models=["gpt-4o"])
+    assert error.message == "Model 'gpt-x' is not supported by openai. Supported: gpt-4o"
+    assert ModelNotSupportedError("gpt-x").message == "Model 'gpt-x' is not supported"
+
+
+def test_empty_details_are_shared():
+    """Exceptions without details share one read-only mapping until written."""
+    first = ChessAnalysisError("a")
+    second = ChessAnalysisError("b")
+    assert first.details is second.details
+    assert not first.details
+
+    first._mutable_details()["key"] = "value"
+    assert first.details == {"key": "value"}
+    assert not second.details
+
+
+def test_hierarchy_is_single_inheritance():
+    """No diamonds, so except-clause matching walks a short linear MRO."""
+    error_classes = [ChessAnalysisError]
+    for cls in error_classes:
+        error_classes.extend(cls.__subclasses__())
+    assert ChessAnalysisError in error_classes
+    assert ModelNotSupportedError in error_classes
+    for cls in error_classes:
+        assert len(cls.__bases__) == 1, cls
+        # At most three levels below ChessAnalysisError
+        assert len(cls.__mro__) <= 7, cls
+
+
+def test_exceptions_pickle_round_trip():
+    """Pickling keeps subclass fields and does not re-run __init__."""
+    error = UserNotFoundError("bob", platform="lichess")
+    restored = pickle.loads(pickle.dumps(error))
+    assert type(restored) is UserNotFoundError
+    assert str(restored) == "User 'bob' not found on lichess"
+    assert restored.username == "bob"
+    assert restored.platform == "lichess"
+
+    error = RateLimitError(platform="chesscom", retry_after=5, endpoint="/x")
+    restored = pickle.loads(pickle.dumps(error))
+    assert restored.status_code == 429
+    assert type(restored.status_code) is int
+    assert restored.retry_after == 5
+    assert restored.details == {"endpoint": "/x"}
+
+
+def test_unpickling_ignores_same_named_classes():
+    """Pickles reference the qualified class, not just its name."""
+    data = pickle.dumps(UserNotFoundError("bob"))
+
+    # A later class with the same name, e.g. from another module
+    type("UserNotFoundError", (ChessAnalysisError,), {"__slots__": ()})
+
+    assert type(pickle.loads(data)) is UserNotFoundError
+
+
+def test_raise_expected_drops_context():
+    """Control-flow raises don't chain to the exception being handled."""
+    try:
+        try:
+            raise KeyError("lookup")
+        except KeyError:
+            RateLimitError.raise_expected(platform="lichess")
+    except RateLimitError as error:
+        assert error.platform == "lichess"
+        assert error.__cause__ is None
+        assert error.__suppress_context__
+
+
+def test_missing_data_error_message():
+    """The message names the missing field and platform."""
+    error = MissingDataError("id", platform="lichess")
+    assert str(error) == "Required field 'id' is missing | Platform: lichess | Field: id"
+    assert error.field == "id"
+
+
+def test_api_error_truncates_response_body():
+    """Only a bounded snippet of the response body is kept."""
+    error = APIError("Server error", status_code=502, response_body="x" * 10_000)
+    assert len(error.response_body) == 512
+    assert APIError("Server error").response_body is None
+
+
+def test_error_collector_builds_errors_lazily():
+    """Recorded errors become exceptions only on request."""
+    collector = ErrorCollector()
+    assert not collector
+    assert collector.first is None
+    collector.raise_if_any()
+
+    collector.record(MissingDataError, "id", platform="lichess")
+    collector.record(NormalizationError, "Bad game", platform="lichess")
+    assert len(collector) == 2
+    assert [type(e) for e in collector.errors] == [MissingDataError, NormalizationError]
+    assert str(collector.first) == "Required field 'id' is missing | Platform: lichess | Field: id"
+
+    try:
+        collector.raise_if_any()
+    except MissingDataError as error:
+        assert error.field == "id"
+    else:
+        raise AssertionError("expected MissingDataError")
@@ -0,0 +1,100 @@
+"""
+Tests for the shared connector behaviour in ConnectorMixin.
+"""
+
+import os
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+# Add project root to path for imports
+project_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.constants import Platform, GameResult, TerminationReason, TimeClass
+from src.core.protocols import ConnectorMixin
+from src.core.schemas import NormalizedGame, PlayerInfo, TimeControl
+
+
+def make_game(index):
+    """Build a game whose id and player rating are derived from index."""
+    return NormalizedGame(
+        game_id=str(index),
+        platform=Platform.LICHESS,
+        url=f"https://lichess.org/{index}",
+        played_at=datetime(2024, 5, 1, tzinfo=timezone.utc),
+        time_control=TimeControl(180, 2, TimeClass.BLITZ),
+        white=PlayerInfo("alice", 1500 + index),
+        black=PlayerInfo("bob", 1500),
+        player_username="alice",
+        result=GameResult.WIN,
+        termination=TerminationReason.RESIGNATION,
+    )
+
+
+class StubConnector(ConnectorMixin):
+    """Connector whose get_games() yields a fixed number of games."""
+
+    def __init__(self, count):
+        self.count = count
+        self.calls = []
+
+    def get_games(self, username, start_date=None, end_date=None, game_filter=None):
+        self.calls.append((username, start_date, end_date, game_filter))
+        for index in range(self.count):
+            yield make_game(index)
+
+
+def batch_ids(batches):
+    """Game ids of each batch, as lists."""
+    return [[game.game_id for game in batch] for batch in batches]
+
+
+def test_batched_exact_multiple():
+    """Games split into full batches with nothing left over."""
+    batches = list(StubConnector(6).get_games_batched("alice", batch_size=3))
+    assert batch_ids(batches) == [["0", "1", "2"], ["3", "4", "5"]]
+
+
+def test_batched_last_partial_batch():
+    """The final batch holds the remainder, in order."""
+    batches = list(StubConnector(7).get_games_batched("alice", batch_size=3))
+    assert batch_ids(batches) == [["0", "1", "2"], ["3", "4", "5"], ["6"]]
+
+
+def test_batched_empty():
+    """No games gives no batches, not an empty one."""
+    assert list(StubConnector(0).get_games_batched("alice", batch_size=3)) == []
+
+
+def test_batched_passes_arguments_through():
+    """Date range and filter reach get_games() unchanged."""
+    connector = StubConnector(1)
+    start = datetime(2024, 1, 1)
+    list(connector.get_games_batched("alice", start, None, None, batch_size=5))
+    assert connector.calls == [("alice", start, None, None)]
+
+
+def test_columns_across_batch_boundaries():
+    """Columns from several batches, including a partial one, join in order."""
+    pytest.importorskip("numpy")
+    columns = StubConnector(7).get_games_columns("alice", batch_size=3)
+    assert columns["player_rating"].tolist() == [1500 + i for i in range(7)]
+    assert {len(column) for column in columns.values()} == {7}
+
+
+def test_columns_single_batch():
+    """A single batch is returned as converted."""
+    pytest.importorskip("numpy")
+    columns = StubConnector(2).get_games_columns("alice", batch_size=3)
+    assert columns["player_rating"].tolist() == [1500, 1501]
+
+
+def test_columns_empty():
+    """No games gives empty arrays for every column."""
+    pytest.importorskip("numpy")
+    columns = StubConnector(0).get_games_columns("alice", batch_size=3)
+    assert "player_rating" in columns
+    assert all(len(column) == 0 for column in columns.values())
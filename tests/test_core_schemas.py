@@ -0,0 +1,152 @@
+"""
+Tests for the normalized game schemas.
+
+Apart from the PGN parsing test, which needs python-chess, these only
+need the standard library.
+"""
+
+import dataclasses
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# Add project root to path for imports
+project_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.constants import (
+    Platform,
+    GameResult,
+    TerminationReason,
+    TimeClass,
+    PlayerColor,
+    MoveClassification,
+)
+from src.core.schemas import MoveAnalysis, NormalizedGame, PlayerInfo, TimeControl
+
+
+def make_game(white="alice", black="bob", player="alice", **kwargs):
+    """Build a minimal game between two players."""
+    return NormalizedGame(
+        game_id="1",
+        platform=Platform.CHESS_COM,
+        url="https://www.chess.com/game/live/1",
+        played_at=datetime(2024, 5, 1, 12, 0),
+        time_control=TimeControl(300, 0, TimeClass.BLITZ),
+        white=PlayerInfo(white, 1500),
+        black=PlayerInfo(black, 1600),
+        player_username=player,
+        result=GameResult.WIN,
+        termination=TerminationReason.CHECKMATE,
+        **kwargs,
+    )
+
+
+def test_player_side_resolution():
+    """The analyzed player's side, player and opponent are resolved together."""
+    game = make_game(player="bob")
+    assert game.player_color is PlayerColor.BLACK
+    assert game.player is game.black
+    assert game.opponent is game.white
+    assert game.player_rating == 1600
+    assert game.opponent_rating == 1500
+
+
+def test_player_side_ignores_username_case():
+    """Usernames that differ only in case still resolve to the right side."""
+    game = make_game(white="Alice", black="BoB", player="alice")
+    assert game.player_color is PlayerColor.WHITE
+    assert game.player is game.white
+
+    game = make_game(white="Alice", black="BoB", player="bOb")
+    assert game.player_color is PlayerColor.BLACK
+    assert game.opponent is game.white
+
+    game.player_username = "ALICE"
+    assert game.player_color is PlayerColor.WHITE
+
+
+def test_player_side_follows_changes():
+    """Reassigning the players or the analyzed username re-resolves the side."""
+    game = make_game()
+    assert game.player_color is PlayerColor.WHITE
+
+    game.player_username = "bob"
+    assert game.player_color is PlayerColor.BLACK
+    assert game.player is game.black
+
+    game.white = PlayerInfo("bob", 1700)
+    assert game.player_color is PlayerColor.WHITE
+    assert game.player_rating == 1700
+
+    game.white.username = "carol"
+    assert game.player_color is PlayerColor.BLACK
+
+
+def make_move(number, is_player_move=True, classification=MoveClassification.GOOD):
+    """Build a move with placeholder notation."""
+    return MoveAnalysis(number, "e4", "e2e4", is_player_move, "", "", classification=classification)
+
+
+def test_classify_player_moves_sees_in_place_edits():
+    """Buckets reflect the current move_analysis, including edits in place."""
+    game = make_game(move_analysis=[
+        make_move(1),
+        make_move(1, is_player_move=False, classification=MoveClassification.BLUNDER),
+        make_move(2, classification=MoveClassification.MISTAKE),
+    ])
+    assert game.classify_player_moves().keys() == {MoveClassification.GOOD, MoveClassification.MISTAKE}
+    assert len(game.player_moves) == 2
+    assert game.blunders == []
+
+    game.move_analysis[0] = make_move(1, classification=MoveClassification.BLUNDER)
+    assert game.blunders == [game.move_analysis[0]]
+
+    game.move_analysis = [make_move(1), make_move(2), make_move(3)]
+    assert game.mistakes == []
+    assert len(game.player_moves) == 3
+
+
+def test_parsed_game_follows_pgn():
+    """Moves follow the current PGN, and each parse is the caller's own."""
+    pytest.importorskip("chess.pgn")
+    game = make_game()
+    assert game.parsed_game() is None
+    assert game.moves_uci == []
+
+    game.pgn = '[Event "Live Chess"]\n\n1. e4 e5 2. Nf3 1-0'
+    assert game.moves_uci == ["e2e4", "e7e5", "g1f3"]
+    parsed = game.parsed_game()
+    parsed.headers["Event"] = "Edited"
+    assert game.parsed_game().headers["Event"] == "Live Chess"
+
+    game.pgn = '[Event "Live Chess"]\n\n1. d4 1-0'
+    assert game.moves_uci == ["d2d4"]
+
+
+def test_asdict_has_only_declared_fields():
+    """Memoized values are not dataclass fields."""
+    game = make_game()
+    game.player_color
+    assert "_side_memo" not in dataclasses.asdict(game)
+    assert all(not f.name.startswith("_") for f in dataclasses.fields(game))
+
+
+def test_time_control_follows_its_fields():
+    """Derived values track the fields and stay out of asdict() and equality."""
+    time_control = TimeControl(180, 2, TimeClass.BLITZ)
+    assert time_control.display_name == "3+2"
+    assert time_control.estimated_game_duration == 260
+
+    time_control.initial_seconds = 300
+    time_control.increment_seconds = 0
+    assert time_control.display_name == "5 min"
+    assert time_control.estimated_game_duration == 300
+
+    assert dataclasses.asdict(time_control).keys() == {
+        "initial_seconds", "increment_seconds", "time_class", "raw_string"
+    }
+    assert time_control == TimeControl(300, 0, TimeClass.BLITZ)